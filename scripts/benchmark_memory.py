@@ -6,10 +6,12 @@
 
 import os
 import sys
-import json
 import tempfile
-import tracemalloc
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 # プロジェクトルートをパスに追加
 script_dir = Path(__file__).parent
@@ -17,11 +19,83 @@ sys.path.insert(0, str(script_dir))
 
 from voicevox_tts import (
     extract_new_assistant_messages,
+    tail_messages,
     TranscriptStreamReader,
-    clean_text_for_speech
+    parse_assistant_line
 )
 
 
+def reset_peak_rss() -> None:
+    """
+    プロセスのピークRSSを現在のRSSまでリセット（Linux のみ）
+
+    /proc/self/clear_refs に 5 を書き込むと VmHWM が現在の VmRSS に戻る。
+    リセットできない環境では何もしない（子プロセス起動時のピークが基準になる）
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss_mb() -> float:
+    """
+    プロセスのピークRSS（最大常駐メモリ）を取得
+
+    tracemalloc と違い全アロケーションをフックしないため、
+    測定対象の処理速度に影響を与えない
+
+    Returns:
+        ピークRSS(MB)
+    """
+    # Linux では reset_peak_rss でリセットできる VmHWM を使う
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss は macOS ではバイト、Linux ではKB単位
+    if sys.platform == "darwin":
+        return max_rss / 1024 / 1024
+    return max_rss / 1024
+
+
+def run_in_child(func, *args) -> tuple:
+    """
+    測定処理を新しい子プロセスで実行する
+
+    ru_maxrss はプロセス生存中の最大値で減ることがないため、
+    同じプロセスで続けて測定すると先の測定のピークに埋もれて増加量が 0 になる。
+    測定ごとにプロセスを分け、他の測定やテストファイル作成の影響を受けないようにする
+
+    Args:
+        func: 子プロセスで実行する測定関数
+        *args: 測定関数に渡す引数
+
+    Returns:
+        測定関数の戻り値
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(func, *args).result()
+
+
+# テスト用 transcript の1行（json.dumps(entry, ensure_ascii=False) と同じ形式）
+# スキーマが固定なので、エントリごとに json.dumps せずに書式化する
+TRANSCRIPT_LINE_TEMPLATE = (
+    '{{"message": {{"role": "assistant", "content": [{{"type": "text", "text": "{text}"}}]}}, '
+    '"timestamp": "{timestamp}"}}\n'
+)
+
+# ファイル書き込みのバッファサイズ（小さな write をまとめる）
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 def create_large_transcript(num_messages: int = 1000) -> str:
     """
     テスト用の大きなtranscriptファイルを作成
@@ -33,83 +107,77 @@ def create_large_transcript(num_messages: int = 1000) -> str:
         作成したファイルのパス
     """
     temp_file = tempfile.NamedTemporaryFile(
-        mode='w',
+        mode='wb',
         suffix='.jsonl',
         delete=False,
-        encoding='utf-8'
+        buffering=WRITE_BUFFER_SIZE
     )
 
     for i in range(num_messages):
-        entry = {
-            "message": {
-                "role": "assistant",
-                "content": [{
-                    "type": "text",
-                    "text": f"これはテストメッセージ {i} です。" * 10  # 長いテキスト
-                }]
-            },
-            "timestamp": f"2026-01-23T00:{i//60:02d}:{i%60:02d}.000Z"
-        }
-        temp_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        temp_file.write(TRANSCRIPT_LINE_TEMPLATE.format(
+            text=f"これはテストメッセージ {i} です。" * 10,  # 長いテキスト
+            timestamp=f"2026-01-23T00:{i//60:02d}:{i%60:02d}.000Z"
+        ).encode('utf-8'))
 
     temp_file.close()
     return temp_file.name
 
 
-def benchmark_traditional_read(file_path: str) -> tuple:
+def benchmark_traditional_read(file_path: str, tail_n: Optional[int] = None) -> tuple:
     """
     従来方式（全ファイル読み込み）のメモリ使用量を測定
+    （run_in_child で子プロセスから呼び出す）
 
     Args:
         file_path: テストファイルのパス
+        tail_n: 指定した場合、全体を読まずに末尾から最新 tail_n 件のみを読み取る
 
     Returns:
-        (ピークメモリ使用量(MB), メッセージ数)
+        (ピークメモリ増加量(MB), メッセージ数)
     """
-    tracemalloc.start()
+    reset_peak_rss()
+    before = get_peak_rss_mb()
 
-    # 全ファイルを読み込む従来方式
-    messages = extract_new_assistant_messages(file_path, last_timestamp=None)
+    if tail_n is None:
+        # 全ファイルを読み込む従来方式
+        messages = extract_new_assistant_messages(file_path, last_timestamp=None)
+    else:
+        # 末尾から必要な件数だけを読み込む方式
+        messages = tail_messages(file_path, tail_n)
 
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    after = get_peak_rss_mb()
 
-    return peak / 1024 / 1024, len(messages)
+    return after - before, len(messages)
 
 
 def benchmark_streaming_read(file_path: str, new_messages_count: int = 10) -> tuple:
     """
     ストリーミング方式のメモリ使用量を測定
     実際の使用シナリオ：ファイル末尾から新しい数行のみを読み取る
+    （run_in_child で子プロセスから呼び出す）
 
     Args:
         file_path: テストファイルのパス
         new_messages_count: 新しく追加されたメッセージ数（シミュレーション）
 
     Returns:
-        (ピークメモリ使用量(MB), メッセージ数)
+        (ピークメモリ増加量(MB), メッセージ数)
     """
     # StreamReaderを開いて末尾に移動（既存データをスキップ）
     reader = TranscriptStreamReader(file_path)
     reader.open()
 
     # ファイルに新しい行を追加（実際の使用シナリオをシミュレート）
-    with open(file_path, 'a', encoding='utf-8') as f:
+    with open(file_path, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
         for i in range(new_messages_count):
-            entry = {
-                "message": {
-                    "role": "assistant",
-                    "content": [{
-                        "type": "text",
-                        "text": f"新しいメッセージ {i} です。" * 10
-                    }]
-                },
-                "timestamp": f"2026-01-23T10:00:{i:02d}.000Z"
-            }
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.write(TRANSCRIPT_LINE_TEMPLATE.format(
+                text=f"新しいメッセージ {i} です。" * 10,
+                timestamp=f"2026-01-23T10:00:{i:02d}.000Z"
+            ).encode('utf-8'))
 
     # ここからメモリ測定開始（新しい行のみを読み取る）
-    tracemalloc.start()
+    reset_peak_rss()
+    before = get_peak_rss_mb()
 
     # 新しく追加された行のみを読み取る
     new_lines = reader.read_new_lines()
@@ -117,36 +185,15 @@ def benchmark_streaming_read(file_path: str, new_messages_count: int = 10) -> tu
     # メッセージをパース
     messages = []
     for line in new_lines:
-        try:
-            entry = json.loads(line)
-            message = entry.get("message", {})
-            timestamp = entry.get("timestamp")
-
-            if message.get("role") == "assistant" and timestamp:
-                content = message.get("content", [])
-                text_parts = [
-                    item.get("text", "")
-                    for item in content
-                    if isinstance(item, dict) and item.get("type") == "text"
-                ]
-
-                if text_parts:
-                    raw_text = " ".join(text_parts)
-                    clean_text = clean_text_for_speech(raw_text)
-                    if clean_text:
-                        messages.append({
-                            "timestamp": timestamp,
-                            "text": clean_text
-                        })
-        except json.JSONDecodeError:
-            continue
+        message = parse_assistant_line(line)
+        if message:
+            messages.append(message)
 
     reader.close()
 
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    after = get_peak_rss_mb()
 
-    return peak / 1024 / 1024, len(messages)
+    return after - before, len(messages)
 
 
 def main():
@@ -163,33 +210,44 @@ def main():
     test_sizes = [100, 500, 1000, 2000, 5000]
     new_messages = 10  # 新しく追加されるメッセージ数
 
-    for size in test_sizes:
-        print(f"[テスト] 既存メッセージ数: {size} + 新規: {new_messages}")
+    # 測定は直列に行い、次のサイズのテストファイル作成だけを裏で先行させる
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        next_file = executor.submit(create_large_transcript, test_sizes[0])
+
+        for i, size in enumerate(test_sizes):
+            print(f"[テスト] 既存メッセージ数: {size} + 新規: {new_messages}")
+
+            # テストファイルを取得し、次のサイズの作成を開始
+            file_path = next_file.result()
+            if i + 1 < len(test_sizes):
+                next_file = executor.submit(create_large_transcript, test_sizes[i + 1])
+
+            file_size = os.path.getsize(file_path) / 1024 / 1024  # MB
 
-        # テストファイルを作成
-        file_path = create_large_transcript(size)
-        file_size = os.path.getsize(file_path) / 1024 / 1024  # MB
+            print(f"  ファイルサイズ: {file_size:.2f} MB")
 
-        print(f"  ファイルサイズ: {file_size:.2f} MB")
+            # 従来方式（全ファイルを読み込んで新しいメッセージを探す）
+            trad_memory, trad_count = run_in_child(benchmark_traditional_read, file_path)
+            print(f"  従来方式（全読込）: {trad_memory:.2f} MB (読込: {trad_count}件)")
 
-        # 従来方式（全ファイルを読み込んで新しいメッセージを探す）
-        trad_memory, trad_count = benchmark_traditional_read(file_path)
-        print(f"  従来方式（全読込）: {trad_memory:.2f} MB (読込: {trad_count}件)")
+            # ストリーミング方式（新しい行のみを読み取る）
+            stream_memory, stream_count = run_in_child(benchmark_streaming_read, file_path, new_messages)
+            print(f"  ストリーミング方式: {stream_memory:.2f} MB (読込: {stream_count}件)")
 
-        # ストリーミング方式（新しい行のみを読み取る）
-        stream_memory, stream_count = benchmark_streaming_read(file_path, new_messages)
-        print(f"  ストリーミング方式: {stream_memory:.2f} MB (読込: {stream_count}件)")
+            # 末尾読込方式（ファイル末尾から新しいメッセージのみを読み取る）
+            tail_memory, tail_count = run_in_child(benchmark_traditional_read, file_path, new_messages)
+            print(f"  末尾読込方式: {tail_memory:.2f} MB (読込: {tail_count}件)")
 
-        # 効率改善率
-        if trad_memory > 0:
-            improvement = ((trad_memory - stream_memory) / trad_memory) * 100
-            print(f"  メモリ削減率: {improvement:.1f}%")
-        else:
-            print(f"  メモリ削減率: N/A")
+            # 効率改善率
+            if trad_memory > 0:
+                improvement = ((trad_memory - stream_memory) / trad_memory) * 100
+                print(f"  メモリ削減率: {improvement:.1f}%")
+            else:
+                print(f"  メモリ削減率: N/A")
 
-        # クリーンアップ
-        os.unlink(file_path)
-        print()
+            # クリーンアップ
+            os.unlink(file_path)
+            print()
 
     print("=" * 60)
     print("ベンチマーク完了")
@@ -4,10 +4,70 @@ VOICEVOX セッション設定管理モジュール
 セッションごとに VOICEVOX の設定を管理する
 """
 
-import json
+import os
+import functools
+import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
+# orjson があれば高速な JSON パーサーを使う
+from voicevox_json import json_loads, json_dumps_pretty_bytes
+
+
+@functools.lru_cache(maxsize=1)
+def _get_umask() -> int:
+    """
+    プロセスの umask を取得（os.umask は設定と同時にしか読めないため、戻して返す）
+
+    Returns:
+        現在の umask
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    JSON ファイルを読み込む（パスと更新時刻・サイズでキャッシュ）
+
+    Args:
+        path: JSON ファイルのパス
+        mtime_ns: ファイルの更新時刻（ナノ秒）
+        size: ファイルサイズ
+
+    Returns:
+        読み込んだ辞書（キャッシュ共有のため変更しないこと）
+    """
+    # 設定ファイルは小さいため、全体を1回で読み込んでバイト列のままパースする
+    return json_loads(Path(path).read_bytes())
+
+
+def load_json_file(path: Path) -> Dict[str, Any]:
+    """
+    JSON ファイルを読み込む
+
+    ファイルが更新されていなければ前回の読み込み結果を再利用する
+
+    Args:
+        path: JSON ファイルのパス
+
+    Returns:
+        読み込んだ辞書のコピー
+    """
+    stat = path.stat()
+    return dict(_load_json_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def clear_config_cache() -> None:
+    """
+    設定ファイルの読み込みキャッシュを破棄
+
+    更新時刻を変えずにファイルを書き換えた場合など、次回の読み込みでファイルを読み直させる
+    """
+    _load_json_cached.cache_clear()
+
 
 def get_session_config_path(session_id: str, project_root: Path) -> Path:
     """
@@ -35,7 +95,10 @@ def load_global_config(project_root: Path) -> Dict[str, Any]:
     """
     global_config_path = project_root / "config" / "voicevox.json"
 
-    if not global_config_path.exists():
+    # 存在確認と更新時刻の取得を stat 1回で済ませる
+    try:
+        return load_json_file(global_config_path)
+    except FileNotFoundError:
         # デフォルト設定を返す
         return {
             "enabled": True,
@@ -45,12 +108,9 @@ def load_global_config(project_root: Path) -> Dict[str, Any]:
             "pitch_scale": 0.0,
             "volume_scale": 1.0,
             "timeout": 60,
-            "audio_output_dir": "/tmp/voicevox_audio"
+            "audio_cache_dir": "~/.cache/voicevox"
         }
 
-    with open(global_config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
 
 def load_session_config(session_id: str, project_root: Path) -> Dict[str, Any]:
     """
@@ -74,11 +134,11 @@ def load_session_config(session_id: str, project_root: Path) -> Dict[str, Any]:
     # セッション設定を読み込む
     session_config_path = get_session_config_path(session_id, project_root)
 
-    if session_config_path.exists():
-        with open(session_config_path, 'r', encoding='utf-8') as f:
-            session_config = json.load(f)
-            # セッション設定でグローバル設定を上書き
-            config.update(session_config)
+    # セッション設定でグローバル設定を上書き
+    try:
+        config.update(load_json_file(session_config_path))
+    except FileNotFoundError:
+        pass
 
     return config
 
@@ -93,13 +153,37 @@ def save_session_config(session_id: str, config: Dict[str, Any], project_root: P
         project_root: プロジェクトルートディレクトリ
     """
     session_config_path = get_session_config_path(session_id, project_root)
-
-    # ディレクトリが存在しない場合は作成
-    session_config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_dir = session_config_path.parent
 
     # 設定を保存
-    with open(session_config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    # 一時ファイルに一括で書き込んでから置き換え、書きかけのファイルが読まれないようにする
+    data = json_dumps_pretty_bytes(config)
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=config_dir, suffix='.tmp')
+    except FileNotFoundError:
+        # ディレクトリが存在しない場合のみ作成する（通常は mkdir を呼ばずに済む）
+        config_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=config_dir, suffix='.tmp')
+
+    try:
+        try:
+            # mkstemp は 0600 で作成するため、open(..., 'w') と同じ権限（0666 & ~umask）に揃える
+            os.fchmod(fd, 0o666 & ~_get_umask())
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # 電源断に備えてディスクへの書き込みを待つ場合のみ fsync する（既定では行わない）
+            if os.environ.get("VOICEVOX_FSYNC") == "1":
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, session_config_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    # 読み込みキャッシュを破棄
+    clear_config_cache()
 
 
 def delete_session_config(session_id: str, project_root: Path) -> None:
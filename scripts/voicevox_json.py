@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+VOICEVOX JSON 入出力モジュール
+orjson があれば使い、なければ標準の json で同じ結果を返す
+"""
+
+import json
+from typing import Any
+
+# orjson があれば transcript・設定ファイルのパースと JSON 化に使う（任意の依存）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# パースに失敗した場合に送出される例外
+# （orjson.JSONDecodeError は json.JSONDecodeError のサブクラス、
+#   標準の json は不正な UTF-8 のバイト列に UnicodeDecodeError を送出する）
+JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+
+    def json_dumps_pretty_bytes(obj: Any) -> bytes:
+        """
+        オブジェクトをインデント付きの JSON（UTF-8 バイト列）に変換
+
+        Args:
+            obj: 変換するオブジェクト
+
+        Returns:
+            2スペースでインデントした JSON のバイト列
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """
+        オブジェクトを JSON の UTF-8 バイト列に変換（orjson.dumps 相当）
+
+        Args:
+            obj: 変換するオブジェクト
+
+        Returns:
+            JSON のバイト列
+        """
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def json_dumps_pretty_bytes(obj: Any) -> bytes:
+        """
+        オブジェクトをインデント付きの JSON（UTF-8 バイト列）に変換
+
+        Args:
+            obj: 変換するオブジェクト
+
+        Returns:
+            2スペースでインデントした JSON のバイト列
+        """
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
@@ -9,19 +9,27 @@ import os
 import time
 import signal
 import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
-from watchdog.observers import Observer
+from typing import Dict, Any, List, Optional, Tuple
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
 # voicevox_tts モジュールをインポート
 from voicevox_tts import (
     check_voicevox_connection,
+    create_http_session,
     extract_new_assistant_messages,
-    create_audio_query,
-    synthesize_speech,
+    audio_cache_key,
+    get_audio_cache_dir,
+    is_cached_audio,
+    prune_audio_cache,
+    synthesize_pipelined,
+    split_sentences,
     play_audio,
-    clean_text_for_speech,
+    parse_assistant_line,
+    ASSISTANT_ROLE_MARKER,
+    DEFAULT_AUDIO_CACHE_MAX_FILES,
     TranscriptStreamReader
 )
 
@@ -29,12 +37,27 @@ from voicevox_tts import (
 class TranscriptFileHandler(FileSystemEventHandler):
     """
     transcript ファイルの変更を検出するハンドラー
+
+    1回の書き込みで複数の変更イベントが届くため、ファイルごとに
+    一定時間イベントをまとめてからモニターに通知する
     """
 
+    # イベントをまとめる待ち時間（秒）
+    DEBOUNCE_SECONDS = 0.075
+
     def __init__(self, monitor: 'TranscriptMonitor'):
         self.monitor = monitor
         super().__init__()
 
+        # ファイルごとの通知待ちタイマー {file_path: Timer}
+        self._pending: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+        # 通知処理を直列化するためのロック
+        self._dispatch_lock = threading.Lock()
+        # close() 後は新しい通知を受け付けない
+        self._closed = False
+
     def on_modified(self, event: FileModifiedEvent):
         """ファイル変更時のコールバック"""
         if event.is_directory:
@@ -44,8 +67,51 @@ class TranscriptFileHandler(FileSystemEventHandler):
         if not event.src_path.endswith('.jsonl'):
             return
 
-        # モニターに通知
-        self.monitor.on_file_modified(event.src_path)
+        # 通知待ちのタイマーがあればリセットする
+        with self._lock:
+            if self._closed:
+                return
+
+            timer = self._pending.get(event.src_path)
+            if timer:
+                timer.cancel()
+
+            timer = threading.Timer(
+                self.DEBOUNCE_SECONDS,
+                self._dispatch,
+                args=(event.src_path,)
+            )
+            timer.daemon = True
+            self._pending[event.src_path] = timer
+            timer.start()
+
+    def _dispatch(self, file_path: str):
+        """まとめたイベントをモニターに通知"""
+        with self._lock:
+            self._pending.pop(file_path, None)
+
+        # モニターに通知（close() 後に発火したタイマーは何もしない）
+        with self._dispatch_lock:
+            if self._closed:
+                return
+            self.monitor.on_file_modified(file_path)
+
+    def close(self):
+        """
+        通知待ちのタイマーをすべて破棄し、以降の通知を止める
+
+        既に発火して通知処理を実行中のタイマーがあれば、その完了を待つ
+        （戻った後はモニターの状態を破棄しても通知処理と競合しない）
+        """
+        with self._lock:
+            self._closed = True
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+
+        # 実行中の通知処理の完了を待つ
+        with self._dispatch_lock:
+            pass
 
 
 class TranscriptMonitor:
@@ -63,16 +129,62 @@ class TranscriptMonitor:
         """
         self.watch_dir = watch_dir
         self.config = config
-        self.observer: Optional[Observer] = None
+
+        # PIDファイル名などに使う watch_dir のハッシュ（毎回計算しないよう保持）
+        # monitor.sh / voicevox_skill.py と同じく md5 の先頭8文字を使う
+        self._watch_dir_hash = hashlib.md5(watch_dir.encode()).hexdigest()[:8]
+        # watchdog の Observer（起動時に作成）
+        self.observer = None
+        self.event_handler: Optional[TranscriptFileHandler] = None
         self.running = False
 
-        # セッションごとの最終読み上げタイムスタンプを記録
-        # {session_id: last_timestamp}
-        self.last_timestamps: Dict[str, str] = {}
+        # セッション（transcript ファイル）ごとの状態を並列リストで管理
+        # 同じインデックスの要素が同じセッションに対応する
+        self._paths: List[str] = []
+        self._readers: List[TranscriptStreamReader] = []
+        self._last_ts: List[Optional[str]] = []  # 最終読み上げタイムスタンプ
+        # {file_path: インデックス}
+        self._session_index: Dict[str, int] = {}
+
+        # 合成済み音声ファイルのキャッシュ（同じ発話の再合成を防ぐ）
+        # {キャッシュキー: WAVファイルパス}
+        self.audio_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.audio_cache_size = 256
 
-        # セッションごとのStreamReaderを管理
-        # {file_path: TranscriptStreamReader}
-        self.stream_readers: Dict[str, TranscriptStreamReader] = {}
+        # VOICEVOX への HTTP 接続を使い回すセッション（初回使用時に作成）
+        self._http = None
+
+        # 読み上げ開始タイムスタンプのキャッシュ
+        # ((st_mtime_ns, st_size), タイムスタンプ)、ファイルが更新されたら読み直す
+        self._enable_cache: Tuple[Optional[Tuple[int, int]], Optional[str]] = (None, None)
+
+    @property
+    def http(self):
+        """
+        VOICEVOX への HTTP 接続を使い回すセッション（keep-alive）
+
+        stop/status では不要なため、requests は初回使用時にインポートする
+
+        Returns:
+            requests.Session
+        """
+        if self._http is None:
+            self._http = create_http_session()
+        return self._http
+
+    @property
+    def last_timestamps(self) -> Dict[str, str]:
+        """
+        セッションごとの最終読み上げタイムスタンプ
+
+        Returns:
+            {session_id: last_timestamp} の辞書
+        """
+        return {
+            Path(file_path).stem: timestamp
+            for file_path, timestamp in zip(self._paths, self._last_ts)
+            if timestamp is not None
+        }
 
     def get_pid_file(self) -> Path:
         """
@@ -82,8 +194,7 @@ class TranscriptMonitor:
             PIDファイルのパス
         """
         # watch_dir をハッシュ化してPIDファイル名に使用
-        watch_dir_hash = hashlib.md5(self.watch_dir.encode()).hexdigest()[:8]
-        return Path(f"/tmp/voicevox_monitor_{watch_dir_hash}.pid")
+        return Path(f"/tmp/voicevox_monitor_{self._watch_dir_hash}.pid")
 
     def get_enable_timestamp_file(self) -> Path:
         """
@@ -92,27 +203,40 @@ class TranscriptMonitor:
         Returns:
             タイムスタンプファイルのパス
         """
-        watch_dir_hash = hashlib.md5(self.watch_dir.encode()).hexdigest()[:8]
-        return Path(f"/tmp/voicevox_enable_{watch_dir_hash}.timestamp")
+        return Path(f"/tmp/voicevox_enable_{self._watch_dir_hash}.timestamp")
 
     def get_enable_timestamp(self) -> Optional[str]:
         """
         読み上げ開始タイムスタンプを取得
 
+        ファイル変更イベントごとに呼ばれるため、ファイルの更新時刻とサイズが
+        変わらない間は前回読み込んだ値を返す
+
         Returns:
             タイムスタンプ（ISO 8601形式）、ファイルが存在しない場合は None
         """
         timestamp_file = self.get_enable_timestamp_file()
-        if not timestamp_file.exists():
+        try:
+            stat = timestamp_file.stat()
+        except FileNotFoundError:
+            self._enable_cache = (None, None)
             return None
 
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if self._enable_cache[0] == file_key:
+            return self._enable_cache[1]
+
         try:
             with open(timestamp_file, 'r') as f:
-                return f.read().strip()
+                timestamp = f.read().strip()
         except Exception as e:
             print(f"[Monitor] タイムスタンプファイルの読み込みに失敗: {e}", file=sys.stderr)
             return None
 
+        # タイムスタンプは固定書式の ISO 8601 文字列のため、文字列のまま比較できる
+        self._enable_cache = (file_key, timestamp)
+        return timestamp
+
     def is_running(self) -> bool:
         """
         モニターが起動中かチェック
@@ -166,57 +290,32 @@ class TranscriptMonitor:
 
         print(f"[Monitor] [{datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]}] ファイル変更検出: {Path(file_path).name}")
 
-        # セッションIDを抽出
-        session_id = Path(file_path).stem
-
-        # StreamReaderを取得または作成
+        # セッションのインデックスを取得または登録
         extract_start = time.time()
-        if file_path not in self.stream_readers:
-            # 新しいファイルの場合、StreamReaderを作成して開く
-            reader = TranscriptStreamReader(file_path)
-            reader.open()
-            self.stream_readers[file_path] = reader
-            print(f"[Monitor] 新しいStreamReaderを作成: {Path(file_path).name}")
+        index = self._session_index.get(file_path)
+        if index is None:
+            index = self._open_session(file_path)
 
         # ストリーミングで新しい行のみを読み取る
-        reader = self.stream_readers[file_path]
-        new_lines = reader.read_new_lines()
+        # パーサーにはバイト列のまま渡し、行ごとのデコードを省く
+        new_lines = self._readers[index].read_new_raw_lines()
 
         if not new_lines:
             return
 
         # 読み取った行をパースしてメッセージを抽出
-        import json
+        # （読み取り位置は前進するのみのため、同じ行を2回読むことはない）
         new_messages = []
         for line in new_lines:
-            try:
-                entry = json.loads(line)
-                message = entry.get("message", {})
-                timestamp = entry.get("timestamp")
-
-                if message.get("role") == "assistant" and timestamp:
-                    # enable_timestamp より新しいメッセージのみを処理
-                    if enable_timestamp and timestamp <= enable_timestamp:
-                        continue
-
-                    content = message.get("content", [])
-                    text_parts = [
-                        item.get("text", "")
-                        for item in content
-                        if isinstance(item, dict) and item.get("type") == "text"
-                    ]
-
-                    if text_parts:
-                        raw_text = " ".join(text_parts)
-                        clean_text = clean_text_for_speech(raw_text)
-                        if clean_text:
-                            new_messages.append({
-                                "timestamp": timestamp,
-                                "text": clean_text
-                            })
-            except json.JSONDecodeError:
+            # assistant を含まない行（ツール結果・ユーザー入力など）はパースしない
+            if ASSISTANT_ROLE_MARKER not in line:
                 continue
 
+            # enable_timestamp より新しいメッセージのみを処理
+            message = parse_assistant_line(line, enable_timestamp)
+            if message:
+                new_messages.append(message)
+
         extract_time = time.time() - extract_start
 
         if not new_messages:
@@ -225,56 +324,65 @@ class TranscriptMonitor:
         print(f"[Monitor] [{datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]}] 新しいメッセージ: {len(new_messages)}件 (抽出: {extract_time:.3f}秒, 検出から: {time.time()-start_time:.3f}秒)")
 
         # 各メッセージを読み上げ
-        output_dir = Path(self.config.get("audio_output_dir", "/tmp/voicevox_audio"))
+        # 再生中に後続メッセージの音声合成を先行して進める
+        output_dir = get_audio_cache_dir(self.config)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Stop フック（voicevox_tts.main）と同じく文単位で合成し、キャッシュキーも文単位にそろえる
+        # キャッシュにない音声のみを合成する（同じ文は1回だけ合成）
+        # 以前の実行や Stop フックで合成済みの音声もディスク上のキャッシュから再利用する
+        plan = []
+        scheduled = set()
         for i, msg in enumerate(new_messages):
-            message_text = msg["text"]
-            timestamp = msg["timestamp"]
+            for j, sentence in enumerate(split_sentences(msg["text"])):
+                cache_key = audio_cache_key(sentence, self.config)
+                needs_synthesis = (
+                    cache_key not in scheduled and self.get_cached_audio(cache_key) is None
+                )
+                if needs_synthesis:
+                    cached_path = str(output_dir / f"{cache_key}.wav")
+                    if is_cached_audio(cached_path):
+                        self.remember_audio(cache_key, cached_path)
+                        needs_synthesis = False
+                if needs_synthesis:
+                    scheduled.add(cache_key)
+                plan.append((i, j, sentence, cache_key, needs_synthesis))
+
+        jobs = [
+            (sentence, str(output_dir / f"{cache_key}.wav"))
+            for _, _, sentence, cache_key, needs_synthesis in plan
+            if needs_synthesis
+        ]
+        synthesized = synthesize_pipelined(jobs, self.config, session=self.http)
+
+        for i, j, sentence, cache_key, needs_synthesis in plan:
             msg_start_time = time.time()
 
-            print(f"[Monitor] [{datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]}] [{i+1}/{len(new_messages)}] 読み上げ: {message_text[:50]}...")
+            if j == 0:
+                print(f"[Monitor] [{datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]}] [{i+1}/{len(new_messages)}] 読み上げ: {new_messages[i]['text'][:50]}...")
 
-            # 音声クエリを作成
-            query_start = time.time()
-            audio_query = create_audio_query(
-                self.config["voicevox_url"],
-                message_text,
-                self.config["speaker_id"],
-                self.config.get("timeout", 30)
-            )
-            query_time = time.time() - query_start
+            if needs_synthesis:
+                # 音声合成の完了を待つ
+                output_path, success = next(synthesized)
+                synth_wait_time = time.time() - msg_start_time
 
-            if not audio_query:
-                print(f"[Monitor] 音声クエリ作成に失敗", file=sys.stderr)
-                continue
+                if not success:
+                    print(f"[Monitor] 音声合成に失敗", file=sys.stderr)
+                    continue
 
-            print(f"[Monitor]   - 音声クエリ作成: {query_time:.3f}秒")
-
-            # 速度、音高、音量を調整
-            audio_query["speedScale"] = self.config.get("speed_scale", 1.0)
-            audio_query["pitchScale"] = self.config.get("pitch_scale", 0.0)
-            audio_query["volumeScale"] = self.config.get("volume_scale", 1.0)
-
-            # 音声を合成
-            synth_start = time.time()
-            output_path = output_dir / f"monitor_{session_id}_{i}.wav"
-            if not synthesize_speech(
-                self.config["voicevox_url"],
-                audio_query,
-                self.config["speaker_id"],
-                str(output_path),
-                self.config.get("timeout", 30)
-            ):
-                print(f"[Monitor] 音声合成に失敗", file=sys.stderr)
-                continue
-            synth_time = time.time() - synth_start
+                self.remember_audio(cache_key, output_path)
+                print(f"[Monitor]   - 音声合成待ち: {synth_wait_time:.3f}秒")
+            else:
+                output_path = self.get_cached_audio(cache_key)
+                if output_path is None:
+                    print(f"[Monitor] 音声合成に失敗", file=sys.stderr)
+                    continue
 
-            print(f"[Monitor]   - 音声合成: {synth_time:.3f}秒")
+                print(f"[Monitor]   - キャッシュ済み音声を使用")
 
             # 音声を再生
             play_start = time.time()
-            if not play_audio(str(output_path)):
+            if not play_audio(output_path):
                 print(f"[Monitor] 音声再生に失敗", file=sys.stderr)
                 continue
             play_time = time.time() - play_start
@@ -283,7 +391,14 @@ class TranscriptMonitor:
             print(f"[Monitor]   - 音声再生: {play_time:.3f}秒 (合計: {total_time:.3f}秒)")
 
             # タイムスタンプを更新
-            self.last_timestamps[session_id] = timestamp
+            self._last_ts[index] = new_messages[i]["timestamp"]
+
+        # 新しく合成した分だけキャッシュが増えるため、上限を超えた古い音声を削除
+        if jobs:
+            prune_audio_cache(
+                output_dir,
+                self.config.get("audio_cache_max_files", DEFAULT_AUDIO_CACHE_MAX_FILES)
+            )
 
     def start(self):
         """モニターを起動"""
@@ -310,29 +425,134 @@ class TranscriptMonitor:
 
         # ファイル監視を開始
         self.running = True
-        event_handler = TranscriptFileHandler(self)
+        # watchdog.observers はプラットフォーム別の監視実装を読み込むため、起動時にインポートする
+        from watchdog.observers import Observer
+
+        self.event_handler = TranscriptFileHandler(self)
         # タイムアウトを短くしてファイル変更の検出を高速化（デフォルト1秒 → 0.1秒）
         self.observer = Observer(timeout=0.1)
-        self.observer.schedule(event_handler, self.watch_dir, recursive=True)
+        self.observer.schedule(self.event_handler, self.watch_dir, recursive=True)
         self.observer.start()
 
         print(f"[Monitor] Observer timeout: 0.1秒 (高速検出モード)")
 
         try:
-            # メインループ（ポーリング間隔を短縮）
+            # メインループ
+            # ファイル変更は Observer のスレッドが処理するため、
+            # メインスレッドは停止シグナルを受け取るまで待機するだけでよい
             while self.running:
-                time.sleep(0.1)
+                signal.pause()
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
 
+    def get_cached_audio(self, cache_key: str) -> Optional[str]:
+        """
+        キャッシュ済みの音声ファイルを取得
+
+        Args:
+            cache_key: audio_cache_key() で求めたキー
+
+        Returns:
+            WAVファイルのパス、キャッシュにない場合は None
+        """
+        output_path = self.audio_cache.get(cache_key)
+        if output_path is None:
+            return None
+
+        # 再利用する音声は prune_audio_cache で古いものから削除される際に残るよう、更新時刻を新しくする
+        try:
+            os.utime(output_path)
+        except FileNotFoundError:
+            del self.audio_cache[cache_key]
+            return None
+        except OSError:
+            pass
+
+        self.audio_cache.move_to_end(cache_key)
+        return output_path
+
+    def remember_audio(self, cache_key: str, output_path: str):
+        """
+        合成した音声ファイルをキャッシュに登録
+
+        上限を超えた場合は最も古いエントリをメモリ上の索引から外す
+        （ファイルは Stop フックと共有のキャッシュにあるため消さない。
+          ディスク上の件数は prune_audio_cache で制限する）
+
+        Args:
+            cache_key: audio_cache_key() で求めたキー
+            output_path: WAVファイルのパス
+        """
+        self.audio_cache[cache_key] = output_path
+        self.audio_cache.move_to_end(cache_key)
+
+        while len(self.audio_cache) > self.audio_cache_size:
+            self.audio_cache.popitem(last=False)
+
+    def _open_session(self, file_path: str) -> int:
+        """
+        新しいファイルのStreamReaderを作成して開き、セッションとして登録
+
+        Args:
+            file_path: transcript ファイルのパス
+
+        Returns:
+            セッションのインデックス
+        """
+        reader = TranscriptStreamReader(file_path)
+        reader.open()
+
+        index = len(self._paths)
+        self._paths.append(file_path)
+        self._readers.append(reader)
+        self._last_ts.append(None)
+        self._session_index[file_path] = index
+        print(f"[Monitor] 新しいStreamReaderを作成: {Path(file_path).name}")
+        return index
+
+    def close_stream_reader(self, file_path: str):
+        """
+        StreamReaderを閉じて、そのセッションの状態をリストから取り除く
+
+        末尾のセッションを空いた位置に移し、セッションごとのリストを詰めたまま保つ
+
+        Args:
+            file_path: transcript ファイルのパス
+        """
+        index = self._session_index.pop(file_path, None)
+        if index is not None:
+            reader = self._readers[index]
+
+            # 末尾のセッションを空いた位置に移して、リストを詰めたまま保つ
+            last = len(self._paths) - 1
+            if index != last:
+                self._paths[index] = self._paths[last]
+                self._readers[index] = self._readers[last]
+                self._last_ts[index] = self._last_ts[last]
+                self._session_index[self._paths[index]] = index
+            del self._paths[last], self._readers[last], self._last_ts[last]
+
+            reader.close()
+
     def stop(self):
         """モニターを停止"""
         if self.observer:
             self.observer.stop()
             self.observer.join()
 
+        # 実行中の通知処理が終わるまで待ってから、読み取り状態と HTTP セッションを破棄する
+        if self.event_handler:
+            self.event_handler.close()
+
+        for file_path in list(self._paths):
+            self.close_stream_reader(file_path)
+
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
         self.running = False
         self.remove_pid_file()
         print("[Monitor] モニター停止")
@@ -6,6 +6,10 @@ VOICEVOX スキルハンドラー
 
 import sys
 import os
+import hashlib
+import functools
+import math
+import select
 import signal
 import subprocess
 import time
@@ -22,6 +26,19 @@ from voicevox_config import (
     delete_session_config
 )
 
+# イベント通知が使えない場合の PID ファイル確認間隔（秒）
+PID_FILE_POLL_INTERVAL = 0.1
+
+# モニタープロセスのコマンドラインに含まれるスクリプト名
+MONITOR_SCRIPT_NAME = "voicevox_monitor.py"
+
+# ps でコマンドラインを確認する際の最大待ち時間（秒）
+PS_TIMEOUT = 2.0
+
+# PID ファイル待ちの1回あたりの最大待ち時間（秒）
+# イベント待ちの間もモニターの異常終了に気付けるよう上限を設ける
+PID_FILE_WAIT_SLICE = 0.5
+
 
 def get_current_session_id() -> Optional[str]:
     """
@@ -36,6 +53,24 @@ def get_current_session_id() -> Optional[str]:
     return os.environ.get("CLAUDE_SESSION_ID")
 
 
+@functools.lru_cache(maxsize=4)
+def _pid_file_for(watch_dir: str) -> Path:
+    """
+    監視ディレクトリに対応するモニターのPIDファイルパスを求める
+
+    Args:
+        watch_dir: モニターの監視対象ディレクトリ
+
+    Returns:
+        PIDファイルのパス
+    """
+    # 監視ディレクトリをハッシュ化してPIDファイル名に使用
+    # （voicevox_monitor.py / monitor.sh と同じく md5 の先頭8文字）
+    watch_dir_hash = hashlib.md5(watch_dir.encode()).hexdigest()[:8]
+    # voicevox_monitor.py と同じく /tmp に配置
+    return Path(f"/tmp/voicevox_monitor_{watch_dir_hash}.pid")
+
+
 def get_monitor_pid_file(project_root: Path) -> Path:
     """
     モニターのPIDファイルパスを取得
@@ -46,9 +81,7 @@ def get_monitor_pid_file(project_root: Path) -> Path:
     Returns:
         PIDファイルのパス
     """
-    import hashlib
-
-    # transcript ディレクトリをハッシュ化してPIDファイル名に使用
+    # transcript ディレクトリからモニターの監視対象ディレクトリを求める
     # （voicevox_monitor.py と同じロジック）
     transcript_dir = os.environ.get("CLAUDE_TRANSCRIPT_PATH", "")
     if transcript_dir:
@@ -57,47 +90,296 @@ def get_monitor_pid_file(project_root: Path) -> Path:
         # デフォルトは voicevox_monitor.py のデフォルト (~/.claude/projects) を使用
         watch_dir = os.path.expanduser("~/.claude/projects")
 
-    watch_dir_hash = hashlib.md5(watch_dir.encode()).hexdigest()[:8]
-    # voicevox_monitor.py と同じく /tmp に配置
-    pid_file = Path(f"/tmp/voicevox_monitor_{watch_dir_hash}.pid")
+    return _pid_file_for(watch_dir)
+
+
+def _read_pid_file(pid_file: Path) -> Optional[int]:
+    """
+    PIDファイルからPIDを読み込む
+
+    Args:
+        pid_file: PIDファイルのパス
+
+    Returns:
+        PID、ファイルが存在しないか内容が不正な場合は None
+    """
+    try:
+        with open(pid_file, 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_monitor_process(pid: int) -> bool:
+    """
+    PID のプロセスがモニター（voicevox_monitor.py）か確認
+
+    PID は再利用されるため、古い PID ファイルが無関係なプロセスを
+    指している場合にモニターと誤認しないようコマンドラインを確認する
+
+    Args:
+        pid: 確認するプロセスのPID
+
+    Returns:
+        モニターのプロセスの場合 True（確認手段がない環境では True）
+    """
+    if os.path.exists("/proc/self/cmdline"):
+        # Linux: /proc から NUL 区切りのコマンドラインを読む
+        try:
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                return MONITOR_SCRIPT_NAME.encode() in f.read()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True
+
+    # macOS など /proc がない環境では ps で確認する
+    try:
+        result = subprocess.run(
+            ["ps", "-p", str(pid), "-o", "command="],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            timeout=PS_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        # 確認できない場合はモニターとみなさない（無関係なプロセスにシグナルを送らない）
+        return False
+    except OSError:
+        return True
 
-    return pid_file
+    if result.returncode != 0:
+        return False
+    return MONITOR_SCRIPT_NAME in result.stdout
 
 
-def is_monitor_running(project_root: Path) -> bool:
+def is_monitor_running(project_root: Path, pid_file: Optional[Path] = None) -> Optional[int]:
     """
     モニターが起動しているか確認
 
     Args:
         project_root: プロジェクトルート
+        pid_file: PIDファイルのパス（省略時は get_monitor_pid_file で求める）
 
     Returns:
-        起動している場合 True、それ以外 False
+        起動している場合はモニターのPID、それ以外 None
     """
-    pid_file = get_monitor_pid_file(project_root)
+    if pid_file is None:
+        pid_file = get_monitor_pid_file(project_root)
 
-    if not pid_file.exists():
-        return False
+    pid = _read_pid_file(pid_file)
+    if pid is None:
+        # PIDファイルが存在しない、または不正
+        pid_file.unlink(missing_ok=True)
+        return None
 
     try:
-        with open(pid_file, 'r') as f:
-            pid = int(f.read().strip())
-
         # プロセスが存在するか確認
         os.kill(pid, 0)
-        return True
-    except (ValueError, ProcessLookupError, OSError):
-        # PIDファイルが不正、またはプロセスが存在しない
+    except OSError:
+        # プロセスが存在しない
         pid_file.unlink(missing_ok=True)
-        return False
+        return None
+
+    # PID が再利用され、別のプロセスを指していないか確認
+    if not _is_monitor_process(pid):
+        pid_file.unlink(missing_ok=True)
+        return None
 
+    return pid
 
-def start_monitor(project_root: Path) -> int:
+
+class _DirectoryWatcher:
+    """
+    ディレクトリ内の特定のファイルの作成・書き込みを待つ
+
+    inotify（Linux）または kqueue（macOS）で変更を待ち、
+    どちらも使えない環境では一定間隔のスリープで代用する
+    （kqueue はファイル名を通知しないため、ディレクトリ内のどの変更でも起きる）
+    """
+
+    def __init__(self, directory: str, name: str):
+        """
+        初期化
+
+        Args:
+            directory: 監視するディレクトリ
+            name: 待つファイルの名前（inotify ではこのファイルのイベントでのみ起きる）
+        """
+        self._name = name
+        self._inotify = None
+        self._kqueue = None
+        self._dir_fd = None
+
+        # inotify があれば PID ファイルの作成をカーネルのイベントで待つ（任意の依存）
+        # on/off/status の起動を遅くしないよう、監視を始めるときにインポートする
+        try:
+            from inotify_simple import INotify, flags as inotify_flags
+        except ImportError:
+            INotify = None
+
+        if INotify is not None:
+            self._inotify = INotify()
+            self._inotify.add_watch(
+                directory,
+                inotify_flags.CREATE | inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE
+            )
+        elif hasattr(select, "kqueue"):
+            # ディレクトリへのエントリ追加は NOTE_WRITE として通知される
+            self._dir_fd = os.open(directory, os.O_RDONLY)
+            self._kqueue = select.kqueue()
+            self._kqueue.control([select.kevent(
+                self._dir_fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE
+            )], 0, 0)
+
+    def wait(self, timeout: float):
+        """
+        対象のファイルに変更があるか、timeout 秒経過するまで待つ
+
+        Args:
+            timeout: 最大待ち時間（秒）
+        """
+        if self._inotify is not None:
+            deadline = time.monotonic() + timeout
+            while True:
+                # 1ミリ秒未満に切り捨てると 0（待たずに返る）になるため、切り上げる
+                events = self._inotify.read(timeout=max(1, math.ceil(timeout * 1000)))
+                # /tmp などの無関係なファイルの変更では起きずに待ち続ける
+                if any(event.name == self._name for event in events):
+                    return
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return
+        elif self._kqueue is not None:
+            self._kqueue.control(None, 1, timeout)
+        else:
+            time.sleep(min(timeout, PID_FILE_POLL_INTERVAL))
+
+    def close(self):
+        """監視を終了"""
+        if self._inotify is not None:
+            self._inotify.close()
+        if self._kqueue is not None:
+            self._kqueue.close()
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+
+
+def _wait_for_pid_file(
+    pid_file: Path,
+    process: subprocess.Popen,
+    watcher: _DirectoryWatcher,
+    timeout: float
+) -> Optional[int]:
+    """
+    起動したモニターが PID ファイルを書き込むまで待つ
+
+    Args:
+        pid_file: PIDファイルのパス
+        process: 起動したモニターのプロセス
+        watcher: PIDファイルのディレクトリを監視する _DirectoryWatcher
+        timeout: 最大待ち時間（秒）
+
+    Returns:
+        モニターのPID、プロセスが終了した場合やタイムアウトした場合は None
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        pid = _read_pid_file(pid_file)
+        if pid is not None:
+            return pid
+
+        if pid_file.exists():
+            # 作成直後で書き込みが終わっていないため、短い間隔で読み直す
+            wait_limit = PID_FILE_POLL_INTERVAL
+        else:
+            wait_limit = PID_FILE_WAIT_SLICE
+
+        if process.poll() is not None:
+            return None
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        watcher.wait(min(remaining, wait_limit))
+
+
+def _wait_pid_exit(pid: int, timeout: float) -> bool:
+    """
+    プロセスの終了を待つ
+
+    Linux では pidfd、macOS では kqueue でプロセスの終了通知を待ち、
+    どちらも使えない環境では os.kill(pid, 0) で一定間隔ごとに確認する
+
+    Args:
+        pid: 待機するプロセスのPID
+        timeout: 最大待ち時間（秒）
+
+    Returns:
+        プロセスが終了した場合 True、タイムアウトした場合 False
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            # 既に終了している
+            return True
+        except OSError:
+            # pidfd に対応していないカーネル
+            pidfd = None
+
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(int(timeout * 1000)))
+            finally:
+                os.close(pidfd)
+
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT
+            )
+            return bool(kq.control([event], 1, timeout))
+        except ProcessLookupError:
+            # 既に終了している
+            return True
+        finally:
+            kq.close()
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(PID_FILE_POLL_INTERVAL)
+
+
+def start_monitor(
+    project_root: Path,
+    pid_file: Optional[Path] = None,
+    check_running: bool = True
+) -> int:
     """
     モニターを起動
 
     Args:
         project_root: プロジェクトルート
+        pid_file: PIDファイルのパス（省略時は get_monitor_pid_file で求める）
+        check_running: False の場合、呼び出し側で is_monitor_running を確認済みとして省略する
 
     Returns:
         起動したモニターのPID
@@ -105,12 +387,14 @@ def start_monitor(project_root: Path) -> int:
     Raises:
         RuntimeError: モニターの起動に失敗した場合
     """
-    # 既に起動している場合はスキップ
-    if is_monitor_running(project_root):
+    if pid_file is None:
         pid_file = get_monitor_pid_file(project_root)
-        with open(pid_file, 'r') as f:
-            pid = int(f.read().strip())
-        return pid
+
+    # 既に起動している場合はスキップ
+    if check_running:
+        pid = is_monitor_running(project_root, pid_file)
+        if pid is not None:
+            return pid
 
     # モニタースクリプトのパス
     monitor_script = project_root / "scripts" / "voicevox_monitor.py"
@@ -125,22 +409,25 @@ def start_monitor(project_root: Path) -> int:
         watch_dir = str(Path(transcript_path).parent)
         cmd.extend(["--watch-dir", watch_dir])
 
-    # バックグラウンドでモニターを起動
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        start_new_session=True
-    )
+    # PIDファイルの作成を取りこぼさないよう、起動前に監視を始める
+    watcher = _DirectoryWatcher(str(pid_file.parent), pid_file.name)
 
-    # PIDファイルが作成されるまで待つ（最大10秒）
-    pid_file = get_monitor_pid_file(project_root)
-    for _ in range(100):
-        if pid_file.exists():
-            with open(pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            return pid
-        time.sleep(0.1)
+    try:
+        # バックグラウンドでモニターを起動
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+        # PIDファイルが作成されるまで待つ（最大10秒）
+        pid = _wait_for_pid_file(pid_file, process, watcher, timeout=10.0)
+    finally:
+        watcher.close()
+
+    if pid is not None:
+        return pid
 
     # タイムアウト：モニターの起動に失敗
     # プロセスが終了したかチェック
@@ -154,43 +441,46 @@ def start_monitor(project_root: Path) -> int:
         raise RuntimeError("モニターの起動がタイムアウトしました")
 
 
-def stop_monitor(project_root: Path) -> bool:
+def stop_monitor(
+    project_root: Path,
+    pid_file: Optional[Path] = None,
+    pid: Optional[int] = None
+) -> bool:
     """
     モニターを停止
 
     Args:
         project_root: プロジェクトルート
+        pid_file: PIDファイルのパス（省略時は get_monitor_pid_file で求める）
+        pid: is_monitor_running で確認済みのモニターのPID（省略時はここで確認する）
 
     Returns:
         停止に成功した場合 True、それ以外 False
     """
-    pid_file = get_monitor_pid_file(project_root)
+    if pid_file is None:
+        pid_file = get_monitor_pid_file(project_root)
 
-    if not pid_file.exists():
+    # PID が再利用されて別のプロセスを指している場合にシグナルを送らないよう、
+    # モニターのプロセスであることを確認してから停止する
+    if pid is None:
+        pid = is_monitor_running(project_root, pid_file)
+    if pid is None:
+        # モニターが起動していない（古いPIDファイルは is_monitor_running が削除済み）
         return True
 
     try:
-        with open(pid_file, 'r') as f:
-            pid = int(f.read().strip())
-
         # プロセスを終了
         os.kill(pid, signal.SIGTERM)
 
         # プロセスが終了するまで待つ（最大5秒）
-        for _ in range(50):
-            try:
-                os.kill(pid, 0)
-                time.sleep(0.1)
-            except ProcessLookupError:
-                # プロセスが終了した
-                break
+        _wait_pid_exit(pid, 5.0)
 
         # PIDファイルを削除
         pid_file.unlink(missing_ok=True)
 
         return True
-    except (ValueError, ProcessLookupError, OSError):
-        # PIDファイルが不正、またはプロセスが存在しない
+    except OSError:
+        # プロセスが存在しない
         pid_file.unlink(missing_ok=True)
         return True
 
@@ -218,8 +508,10 @@ def execute_on(session_id: str, project_root: Path) -> str:
     save_session_config(session_id, config, project_root)
 
     # モニターが起動していない場合、モニターを起動
-    if not is_monitor_running(project_root):
-        pid = start_monitor(project_root)
+    pid_file = get_monitor_pid_file(project_root)
+    if is_monitor_running(project_root, pid_file) is None:
+        # 起動していないことは確認済みのため、start_monitor では確認し直さない
+        pid = start_monitor(project_root, pid_file, check_running=False)
         return f"✅ VOICEVOX読み上げを有効化しました (session: {session_id}, monitor PID: {pid})"
     else:
         return f"✅ VOICEVOX読み上げを有効化しました (session: {session_id})"
@@ -248,8 +540,10 @@ def execute_off(session_id: str, project_root: Path) -> str:
     save_session_config(session_id, config, project_root)
 
     # モニターが起動している場合、モニターを停止
-    if is_monitor_running(project_root):
-        stop_monitor(project_root)
+    pid_file = get_monitor_pid_file(project_root)
+    pid = is_monitor_running(project_root, pid_file)
+    if pid is not None:
+        stop_monitor(project_root, pid_file, pid)
         return f"⛔ VOICEVOX読み上げを無効化しました (session: {session_id}, monitor stopped)"
     else:
         return f"⛔ VOICEVOX読み上げを無効化しました (session: {session_id})"
@@ -2,50 +2,164 @@
 """
 VOICEVOX TTS メイン音声読み上げスクリプト
 ClaudeCode の Stop フックから呼び出されます
+
+タイムスタンプは transcript と同じ固定長の UTC 形式（例: 2026-01-23T00:00:00.000Z）で扱う
+この形式は文字列の大小と時刻の前後が一致するため、datetime に変換せずに文字列のまま比較する
+（monitor.sh が書き込む読み上げ開始時刻も同じ形式）
 """
 
 import sys
 import os
-import json
+import re
+import hashlib
+import functools
+import mmap
+import shutil
+import socket
 import subprocess
+import tempfile
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import requests
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterable, Iterator, Union
+
+# requests は読み込みに時間がかかるため、HTTP 通信を行う関数の中でインポートする
+# （読み上げが無効な場合は読み込まずに終了できる）
+if TYPE_CHECKING:
+    import requests
 
 # セッション設定管理モジュールをインポート
-from voicevox_config import load_session_config
+from voicevox_config import load_session_config, load_json_file
+# transcript のパースと音声合成リクエストの JSON 化（orjson があれば使う）
+from voicevox_json import json_loads, json_dumps_bytes, JSON_DECODE_ERRORS
 
 
 def load_config(config_path: Path) -> Dict[str, Any]:
     """
     設定ファイルを読み込む
 
+    ファイルが更新されていなければ前回の読み込み結果を再利用する
+
     Args:
         config_path: 設定ファイルのパス
 
     Returns:
-        設定辞書
+        設定辞書（呼び出し側で変更しても共有のキャッシュには影響しない）
+    """
+    return load_json_file(Path(config_path))
+
+
+# VOICEVOX への HTTP 接続を使い回す共有セッション（初回使用時に作成）
+_session: Optional["requests.Session"] = None
+
+# 音声合成の同時実行数の上限（エンジンを過負荷にしないよう CPU コア数まで）
+MAX_SYNTHESIS_WORKERS = os.cpu_count() or 2
+
+
+# 接続エラー時の再試行回数と待ち時間の係数（リクエスト送信前の失敗のみ再試行される）
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.2
+
+
+def create_http_session() -> "requests.Session":
     """
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    VOICEVOX Engine 用の HTTP セッションを作成
 
+    keep-alive 接続を音声合成の同時実行数まで保持し、エンジンの起動直後などの
+    接続エラーは短い間隔で再試行する（POST は送信前の失敗のみ再試行される）
 
-def check_voicevox_connection(voicevox_url: str, timeout: int = 5) -> bool:
+    Returns:
+        requests.Session
+    """
+    import requests
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_SYNTHESIS_WORKERS,
+        max_retries=Retry(total=HTTP_MAX_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF)
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session() -> "requests.Session":
+    """
+    モジュール共有の HTTP セッションを取得
+
+    同じ VOICEVOX Engine への連続したリクエストで keep-alive 接続を再利用する
+
+    Returns:
+        requests.Session
+    """
+    global _session
+    if _session is None:
+        _session = create_http_session()
+    return _session
+
+
+def _close_session():
+    """モジュール共有の HTTP セッションを閉じて、保持している接続を解放"""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+# 接続チェックのデフォルトのタイムアウト秒数（TCP 接続のみ / HTTP リクエストまで）
+CONNECT_CHECK_TIMEOUT = 1
+HTTP_CHECK_TIMEOUT = 5
+
+
+def check_voicevox_connection(
+    voicevox_url: str,
+    timeout: Optional[float] = None,
+    session: Optional["requests.Session"] = None,
+    verify_http: bool = False
+) -> bool:
     """
     VOICEVOX Engine への接続をチェック
 
+    通常は TCP 接続ができるかだけを確認する（エンジンが停止している場合も
+    すぐに結果が返る）。verify_http=True の場合は GET /version の応答まで確認する
+
     Args:
         voicevox_url: VOICEVOX Engine の URL
-        timeout: タイムアウト秒数
+        timeout: タイムアウト秒数（省略時は TCP 接続のみなら 1 秒、HTTP なら 5 秒）
+        session: 接続を再利用する HTTP セッション（省略時はモジュール共有のセッション）
+        verify_http: True の場合、HTTP リクエストで応答を確認する
 
     Returns:
         接続可能な場合 True
     """
+    if not verify_http:
+        url = urlsplit(voicevox_url)
+        if not url.hostname:
+            return False
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            with socket.create_connection(
+                (url.hostname, port),
+                timeout=CONNECT_CHECK_TIMEOUT if timeout is None else timeout
+            ):
+                return True
+        except (OSError, ValueError):
+            return False
+
+    import requests
+
+    http = session or _get_session()
     try:
-        response = requests.get(f"{voicevox_url}/version", timeout=timeout)
+        response = http.get(
+            f"{voicevox_url}/version",
+            timeout=HTTP_CHECK_TIMEOUT if timeout is None else timeout
+        )
         return response.status_code == 200
-    except requests.exceptions.RequestException:
+    except (requests.exceptions.RequestException, ValueError):
+        # ValueError: requests が受け付けないタイムアウト（0 以下）が指定された場合
         return False
 
 
@@ -65,41 +179,75 @@ class TranscriptStreamReader:
         self.file_path = file_path
         self.file_handle = None
         self.current_position = 0
+        # 改行がまだ書き込まれていない末尾の行（次回の読み取りで続きと結合する）
+        self._tail = b''
 
     def open(self):
         """
         ファイルを開いて現在位置を末尾にセット
         既存の内容をスキップして、これから追加される行のみを読み取る
         """
-        self.file_handle = open(self.file_path, 'r', encoding='utf-8')
+        # バイナリ・バッファなしで開き、改行の検索はバイト列のまま行う
+        self.file_handle = open(self.file_path, 'rb', buffering=0)
         # 既存の内容をスキップして末尾に移動
         self.file_handle.seek(0, 2)  # SEEK_END (0: offset, 2: whence=end)
         self.current_position = self.file_handle.tell()
+        self._tail = b''
 
     def read_new_lines(self) -> List[str]:
         """
         新しく追加された行のみを読み取る
 
+        改行で終わっていない末尾の行は、書き込みが完了するまで返さない
+
         Returns:
             新しい行のリスト（空白行は除外）
         """
+        return [line.decode('utf-8', errors='replace') for line in self.read_new_raw_lines()]
+
+    def read_new_raw_lines(self) -> List[bytes]:
+        """
+        新しく追加された行を、デコードせずにバイト列のまま読み取る
+
+        JSON パーサーにそのまま渡す場合は、こちらを使うと行ごとのデコードを省ける
+
+        Returns:
+            行のバイト列のリスト（空白行は除外）
+        """
         if not self.file_handle:
             return []
 
+        # 追記された分のサイズを求め、自前で保持しているオフセットから
+        # pread 1回でまとめて読み取る（seek 不要）
+        fd = self.file_handle.fileno()
+        appended = os.fstat(fd).st_size - self.current_position
+        if appended <= 0:
+            return []
+
+        data = os.pread(fd, appended, self.current_position)
+        if not data:
+            return []
+
+        buf = self._tail + data
+
+        # 現在位置を更新
+        self.current_position += len(data)
+
+        # bytes.find（memchr）で改行を探して行に分割する
         new_lines = []
+        start = 0
         while True:
-            line = self.file_handle.readline()
-            if not line:
-                # EOF到達
+            newline = buf.find(b'\n', start)
+            if newline == -1:
                 break
 
             # 空白行を除外
-            stripped = line.strip()
-            if stripped:
-                new_lines.append(stripped)
+            line = buf[start:newline].strip()
+            if line:
+                new_lines.append(line)
+            start = newline + 1
 
-        # 現在位置を更新
-        self.current_position = self.file_handle.tell()
+        self._tail = buf[start:]
         return new_lines
 
     def close(self):
@@ -119,34 +267,132 @@ class TranscriptStreamReader:
         return False
 
 
+# 読み上げ時に除去する記号（Markdown記号と一部の絵文字）
+# 1文字単位の除去は正規表現ではなく str.translate で行う
+_STRIP_TABLE = dict.fromkeys(map(ord, '*_~`#✅❌🎉📊⚡🔧'), None)
+
+# 除去対象の記法をまとめた正規表現（テキストを1回の走査で処理する）
+_SPEECH_CLEANUP_RE = re.compile(
+    r'```[a-z]*\n[\s\S]*?```'       # コードブロック除去
+    r'|`[^`]+`'                     # インラインコード除去
+    r'|\[(?P<link>[^\]]+)\]\([^\)]+\)'  # リンク [text](url) → text
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _speech_cleanup_replacement(match: "re.Match") -> str:
+    """_SPEECH_CLEANUP_RE のマッチ箇所の置換文字列を返す"""
+    # リンクはテキスト部分のみ残し、コードは除去する
+    return match.group('link') or ''
+
+
+@functools.lru_cache(maxsize=256)
 def clean_text_for_speech(text: str) -> str:
     """
     音声読み上げ用にテキストをクリーンアップ
 
+    同じ transcript を読み直した場合に備え、直近の結果をキャッシュする
+
     Args:
         text: 元のテキスト
 
     Returns:
         クリーンアップされたテキスト
     """
-    import re
+    # コード・リンクを処理してから、Markdown記号・絵文字を除去
+    text = _SPEECH_CLEANUP_RE.sub(_speech_cleanup_replacement, text)
+    text = text.translate(_STRIP_TABLE)
+
+    # 連続する空白を1つにして、前後の空白を削除
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
 
-    # Markdown記号を除去
-    text = re.sub(r'[*_~`#]', '', text)  # *, _, ~, `, # を削除
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)  # リンク [text](url) → text
-    text = re.sub(r'```[a-z]*\n[\s\S]*?```', '', text)  # コードブロック除去
-    text = re.sub(r'`[^`]+`', '', text)  # インラインコード除去
+# 文（句点・感嘆符・疑問符・改行までの区切り）
+_SENTENCE_RE = re.compile(r'[^。！？\n]+[。！？]*')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    テキストを文単位に分割
 
-    # 絵文字を除去（一部）
-    text = re.sub(r'[✅❌🎉📊⚡🔧]', '', text)
+    長いメッセージを文ごとに音声合成することで、最初の文の再生を早く始め、
+    再生中に後続の文の合成を進められるようにする
 
-    # 連続する空白を1つに
-    text = re.sub(r'\s+', ' ', text)
+    Args:
+        text: 読み上げテキスト
+
+    Returns:
+        文のリスト（句読点は各文の末尾に残す、空の文は除外）
+    """
+    sentences = []
+    for sentence in _SENTENCE_RE.findall(text):
+        sentence = sentence.strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
 
-    # 前後の空白を削除
-    text = text.strip()
 
-    return text
+# assistant メッセージの行に必ず含まれるバイト列（JSON パース前の絞り込みに使う）
+# "role": "assistant" / "role":"assistant" のどちらの書式にも一致する
+ASSISTANT_ROLE_MARKER = b'"assistant"'
+
+# transcript を先頭から読む際に1回で読み取るバイト数
+TRANSCRIPT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_marked_lines(
+    f,
+    marker: bytes,
+    chunk_size: int = TRANSCRIPT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    バイナリファイルを大きめのチャンクで読み、marker を含む完全な行だけを返す
+
+    チャンク内で marker を find し、その前後の改行位置から行を切り出すため、
+    marker を含まない行はバイト列として切り出すことすらしない
+
+    Args:
+        f: バイナリモードで開いたファイル
+        marker: 行に含まれているべきバイト列
+        chunk_size: 1回に読み取るバイト数
+
+    Yields:
+        marker を含み改行で終わる行のバイト列（改行を含まない）
+
+    Returns:
+        末尾の改行で終わっていない部分（書き込み途中の行、なければ b''）
+    """
+    # チャンクをまたぐ行の断片（長い行でも連結は1回で済むようリストに溜める）
+    pending = []
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+
+        first_newline = chunk.find(b'\n')
+        if first_newline < 0:
+            pending.append(chunk)
+            continue
+
+        # 前のチャンクから続く行
+        pending.append(chunk[:first_newline])
+        line = b''.join(pending)
+        if marker in line:
+            yield line
+
+        # このチャンク内で完結している行
+        last_newline = chunk.rfind(b'\n')
+        position = chunk.find(marker, first_newline + 1, last_newline)
+        while position >= 0:
+            start = chunk.rfind(b'\n', 0, position) + 1
+            end = chunk.find(b'\n', position)
+            yield chunk[start:end]
+            position = chunk.find(marker, end + 1, last_newline)
+
+        pending = [chunk[last_newline + 1:]]
+
+    return b''.join(pending)
 
 
 def extract_latest_assistant_message(transcript_path: str) -> Optional[str]:
@@ -159,39 +405,277 @@ def extract_latest_assistant_message(transcript_path: str) -> Optional[str]:
     Returns:
         最新の assistant メッセージテキスト、見つからない場合は None
     """
-    if not os.path.exists(transcript_path):
+    try:
+        f = open(transcript_path, 'rb')
+    except FileNotFoundError:
         return None
 
-    latest_assistant_message = None
-
-    with open(transcript_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                entry = json.loads(line)
+    with f:
+        # 空ファイルは mmap できない
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # ファイル全体をページキャッシュのまま参照し、末尾から assistant マーカーを rfind で探す
+        # （行への分割やブロックごとのコピーをせず、候補の行だけを取り出してパースする）
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while True:
+                position = mm.rfind(ASSISTANT_ROLE_MARKER, 0, end)
+                if position < 0:
+                    return None
+                start = mm.rfind(b'\n', 0, position) + 1
+                line_end = mm.find(b'\n', position)
+                if line_end < 0:
+                    line_end = len(mm)
+                # 次はこの行より前を探す
+                end = start
+
+                try:
+                    entry = json_loads(mm[start:line_end])
+                except JSON_DECODE_ERRORS:
+                    continue
 
                 # assistant ロールのメッセージを探す
                 # ClaudeCodeのtranscript形式: {"message": {"role": "assistant", "content": [...]}}
                 message = entry.get("message", {})
                 if message.get("role") == "assistant":
-                    content = message.get("content", [])
+                    # content から text を抽出（中間リストを作らずに join する）
+                    # テキストが空のメッセージは parse_assistant_entry と同様に読み飛ばす
+                    text = " ".join(
+                        item["text"] for item in message.get("content", [])
+                        if type(item) is dict and item.get("type") == "text" and item.get("text")
+                    )
+                    if text:
+                        return text
+
+
+def parse_assistant_entry(
+    entry: Dict[str, Any],
+    after_timestamp: Optional[str] = None
+) -> Optional[Dict[str, str]]:
+    """
+    transcript のエントリから assistant メッセージを抽出
+
+    Args:
+        entry: transcript JSONL の1行をデコードした辞書
+        after_timestamp: このタイムスタンプ以前のメッセージは除外（ISO 8601形式）
+
+    Returns:
+        {"timestamp": "...", "text": "..."} の辞書、対象外のエントリは None
+    """
+    # ClaudeCodeのtranscript形式: {"message": {"role": "assistant", "content": [...]}, "timestamp": "..."}
+    message = entry.get("message", {})
+    timestamp = entry.get("timestamp")
+
+    if message.get("role") != "assistant" or not timestamp:
+        return None
 
-                    # content から text を抽出
-                    text_parts = []
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") == "text":
-                            text_parts.append(item.get("text", ""))
+    # after_timestamp より新しいメッセージのみを抽出（固定長の ISO 8601 のため文字列のまま比較）
+    if after_timestamp is not None and timestamp <= after_timestamp:
+        return None
 
-                    if text_parts:
-                        latest_assistant_message = " ".join(text_parts)
+    # content から text を抽出（中間リストを作らずに join する）
+    # "text" キーを持たない不正な要素は読み飛ばす
+    raw_text = " ".join(
+        item["text"] for item in message.get("content", [])
+        if type(item) is dict and item.get("type") == "text" and "text" in item
+    )
+    if not raw_text:
+        return None
 
-            except json.JSONDecodeError:
+    # 音声読み上げ用にテキストをクリーンアップ
+    clean_text = clean_text_for_speech(raw_text)
+    if not clean_text:  # クリーンアップ後に文字が残らない場合は除外
+        return None
+
+    return {"timestamp": timestamp, "text": clean_text}
+
+
+def parse_assistant_line(
+    line: Union[str, bytes],
+    after_timestamp: Optional[str] = None
+) -> Optional[Dict[str, str]]:
+    """
+    transcript の1行をパースして assistant メッセージを抽出
+
+    エントリ全体は保持せず、timestamp と読み上げ用テキストのみを返す
+
+    Args:
+        line: transcript JSONL の1行（文字列、または UTF-8 のバイト列）
+        after_timestamp: このタイムスタンプ以前のメッセージは除外（ISO 8601形式）
+
+    Returns:
+        {"timestamp": "...", "text": "..."} の辞書、対象外の行は None
+    """
+    try:
+        entry = json_loads(line)
+    except JSON_DECODE_ERRORS:
+        return None
+
+    return parse_assistant_entry(entry, after_timestamp)
+
+
+def _iter_lines_reverse(file_path: str, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    ファイルの行を末尾から先頭に向かって順に返す
+
+    ファイル末尾から block_size ずつ遡って読み取るため、
+    末尾付近の行だけが必要な場合にファイル全体を読まずに済む
+
+    Args:
+        file_path: ファイルパス
+        block_size: 1回に読み取るバイト数
+
+    Yields:
+        行のバイト列（空白行は除外）
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        position = os.fstat(fd).st_size
+        # ブロック先頭で途切れている行の断片（末尾側から順に溜め、行が揃った時点で1回だけ連結する）
+        fragments = []
+
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            # 位置指定読み取りで seek と read のシステムコールを1回にまとめる
+            block = os.pread(fd, read_size, position)
+
+            first_newline = block.find(b'\n')
+            if first_newline < 0:
+                fragments.append(block)
                 continue
 
-    return latest_assistant_message
+            # 後ろのブロックから続いていた行
+            last_newline = block.rfind(b'\n')
+            fragments.append(block[last_newline + 1:])
+            line = b''.join(reversed(fragments))
+            if line.strip():
+                yield line
+
+            # このブロック内で完結している行
+            for line in reversed(block[first_newline + 1:last_newline].split(b'\n')):
+                if line.strip():
+                    yield line
+
+            fragments = [block[:first_newline]]
+
+        head = b''.join(reversed(fragments))
+        if head.strip():
+            yield head
+    finally:
+        os.close(fd)
+
+
+def tail_messages(
+    transcript_path: str,
+    n: int,
+    since_timestamp: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    transcript の末尾から最新の assistant メッセージを最大 n 件抽出
+
+    ファイルを末尾から読み、n 件集まるか since_timestamp 以前の
+    エントリに到達した時点で読み取りを終える
+
+    Args:
+        transcript_path: transcript ファイルのパス
+        n: 抽出する最大件数
+        since_timestamp: このタイムスタンプ以前のメッセージは除外（ISO 8601形式）
+
+    Returns:
+        assistant メッセージのリスト（古い順）
+        各要素は {"timestamp": "...", "text": "..."} の辞書
+    """
+    if n <= 0 or not os.path.exists(transcript_path):
+        return []
+
+    messages = []
+    for line in _iter_lines_reverse(transcript_path):
+        try:
+            entry = json_loads(line)
+        except JSON_DECODE_ERRORS:
+            continue
+
+        # transcript は時系列順のため、since_timestamp 以前に到達したら終了
+        timestamp = entry.get("timestamp")
+        if since_timestamp is not None and timestamp and timestamp <= since_timestamp:
+            break
+
+        message = parse_assistant_entry(entry, since_timestamp)
+        if message:
+            messages.append(message)
+            if len(messages) >= n:
+                break
+
+    messages.reverse()
+    return messages
+
+
+def iter_assistant_messages(
+    lines: Iterable[bytes],
+    last_timestamp: Optional[str] = None
+) -> Iterator[Dict[str, str]]:
+    """
+    transcript の行から assistant メッセージを順に取り出す
+
+    リストを作らずに1件ずつ返すため、呼び出し側は全行のパースを待たずに処理を始められる
+
+    Args:
+        lines: transcript JSONL の行（UTF-8 のバイト列）のイテラブル
+        last_timestamp: このタイムスタンプ以前のメッセージは除外（ISO 8601形式）
+
+    Yields:
+        {"timestamp": "...", "text": "..."} の辞書
+    """
+    # ループ内で毎回グローバル変数を引かないよう、ローカル変数に束縛しておく
+    marker = ASSISTANT_ROLE_MARKER
+    loads = json_loads
+    parse_entry = parse_assistant_entry
+
+    for line in lines:
+        # 空白行や assistant を含まない行（ツール結果・ユーザー入力など）はパースしない
+        # 行末の改行は JSON パーサーが空白として読み飛ばすため strip しない
+        if marker not in line:
+            continue
+
+        # parse_assistant_line と同じ処理を、関数呼び出しを1段減らして行う
+        try:
+            entry = loads(line)
+        except JSON_DECODE_ERRORS:
+            continue
+
+        message = parse_entry(entry, last_timestamp)
+        if message:
+            yield message
+
+
+def iter_new_assistant_messages(
+    transcript_path: str,
+    last_timestamp: Optional[str] = None
+) -> Iterator[Dict[str, str]]:
+    """
+    transcript JSONL ファイルから新しい assistant メッセージを順に取り出す
+
+    Args:
+        transcript_path: transcript ファイルのパス
+        last_timestamp: 前回読み上げた最後のタイムスタンプ（ISO 8601形式）
+                       None の場合は全てのメッセージを抽出
+
+    Yields:
+        {"timestamp": "...", "text": "..."} の辞書
+    """
+    if not os.path.exists(transcript_path):
+        return
+
+    def lines() -> Iterator[bytes]:
+        tail = yield from _iter_marked_lines(f, ASSISTANT_ROLE_MARKER)
+        if tail:
+            yield tail
+
+    # バイト列のまま JSON パーサーに渡し、行ごとのデコードを省く
+    # 読み取りは自前でチャンク単位に行うため、バッファリングは不要
+    with open(transcript_path, 'rb', buffering=0) as f:
+        yield from iter_assistant_messages(lines(), last_timestamp)
 
 
 def extract_new_assistant_messages(
@@ -210,57 +694,60 @@ def extract_new_assistant_messages(
         新しい assistant メッセージのリスト
         各要素は {"timestamp": "...", "text": "..."} の辞書
     """
-    if not os.path.exists(transcript_path):
-        return []
+    return list(iter_new_assistant_messages(transcript_path, last_timestamp))
 
-    new_messages = []
 
-    with open(transcript_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+def extract_new_assistant_messages_with_offset(
+    transcript_path: str,
+    last_timestamp: Optional[str] = None,
+    start_offset: int = 0
+) -> Tuple[List[Dict[str, str]], int]:
+    """
+    transcript JSONL ファイルの start_offset 以降から新しい assistant メッセージを抽出
 
-            try:
-                entry = json.loads(line)
+    前回の読み取り終了位置から読み始めることで、追記された行のみをパースする
 
-                # assistant ロールのメッセージを探す
-                # ClaudeCodeのtranscript形式: {"message": {"role": "assistant", "content": [...]}, "timestamp": "..."}
-                message = entry.get("message", {})
-                timestamp = entry.get("timestamp")
-
-                if message.get("role") == "assistant" and timestamp:
-                    # last_timestamp より新しいメッセージのみを抽出
-                    if last_timestamp is None or timestamp > last_timestamp:
-                        content = message.get("content", [])
-
-                        # content から text を抽出
-                        text_parts = []
-                        for item in content:
-                            if isinstance(item, dict) and item.get("type") == "text":
-                                text_parts.append(item.get("text", ""))
-
-                        if text_parts:
-                            raw_text = " ".join(text_parts)
-                            # 音声読み上げ用にテキストをクリーンアップ
-                            clean_text = clean_text_for_speech(raw_text)
-                            if clean_text:  # クリーンアップ後も文字が残っている場合のみ追加
-                                new_messages.append({
-                                    "timestamp": timestamp,
-                                    "text": clean_text
-                                })
-
-            except json.JSONDecodeError:
-                continue
+    Args:
+        transcript_path: transcript ファイルのパス
+        last_timestamp: 前回読み上げた最後のタイムスタンプ（ISO 8601形式）
+                       None の場合は全てのメッセージを抽出
+        start_offset: 読み取りを開始するバイト位置（行頭）
+                      ファイルサイズを超える場合はファイルが作り直されたとみなし先頭から読む
 
-    return new_messages
+    Returns:
+        (新しい assistant メッセージのリスト, 次回の読み取り開始位置) のタプル
+        読み取り開始位置は最後の完全な行（改行で終わる行）の直後
+    """
+    if not os.path.exists(transcript_path):
+        return [], 0
+
+    # バイト列のまま JSON パーサーに渡し、行ごとのデコードを省く
+    # 読み取りは自前でチャンク単位に行うため、バッファリングは不要
+    with open(transcript_path, 'rb', buffering=0) as f:
+        if start_offset > os.fstat(f.fileno()).st_size:
+            start_offset = 0
+        f.seek(start_offset)
+        offset = start_offset
+
+        def lines() -> Iterator[bytes]:
+            nonlocal offset
+            tail = yield from _iter_marked_lines(f, ASSISTANT_ROLE_MARKER)
+            # 書き込み途中の末尾行は次回読み直すため、位置を進めない
+            offset = f.tell() - len(tail)
+            if tail:
+                yield tail
+
+        new_messages = list(iter_assistant_messages(lines(), last_timestamp))
+
+    return new_messages, offset
 
 
 def create_audio_query(
     voicevox_url: str,
     text: str,
     speaker_id: int,
-    timeout: int = 30
+    timeout: int = 30,
+    session: Optional["requests.Session"] = None
 ) -> Optional[Dict[str, Any]]:
     """
     音声クエリを作成
@@ -270,21 +757,36 @@ def create_audio_query(
         text: 読み上げテキスト
         speaker_id: 話者ID
         timeout: タイムアウト秒数
+        session: 接続を再利用する HTTP セッション（省略時はモジュール共有のセッション）
 
     Returns:
         音声クエリ辞書、失敗時は None
     """
+    import requests
+
+    http = session or _get_session()
     try:
-        response = requests.post(
+        response = http.post(
             f"{voicevox_url}/audio_query",
             params={"text": text, "speaker": speaker_id},
             timeout=timeout
         )
         response.raise_for_status()
-        return response.json()
+        # 音声クエリはモーラごとの配列を含み大きいため、共通の JSON パーサーで読む
+        return json_loads(response.content)
     except requests.exceptions.RequestException as e:
         print(f"音声クエリの作成に失敗: {e}", file=sys.stderr)
         return None
+    except JSON_DECODE_ERRORS as e:
+        print(f"音声クエリの作成に失敗（応答が JSON ではありません）: {e}", file=sys.stderr)
+        return None
+
+
+# 合成音声をファイルへ書き込む際のチャンクサイズ（バイト）
+SYNTHESIS_CHUNK_SIZE = 64 * 1024
+
+# 音声合成の同時実行数のデフォルト値
+DEFAULT_SYNTHESIS_WORKERS = 2
 
 
 def synthesize_speech(
@@ -292,7 +794,8 @@ def synthesize_speech(
     audio_query: Dict[str, Any],
     speaker_id: int,
     output_path: str,
-    timeout: int = 30
+    timeout: int = 30,
+    session: Optional["requests.Session"] = None
 ) -> bool:
     """
     音声を合成してファイルに保存
@@ -303,29 +806,286 @@ def synthesize_speech(
         speaker_id: 話者ID
         output_path: 出力WAVファイルパス
         timeout: タイムアウト秒数
+        session: 接続を再利用する HTTP セッション（省略時はモジュール共有のセッション）
 
     Returns:
         成功時 True
     """
+    import requests
+    import urllib3
+
+    http = session or _get_session()
     try:
-        response = requests.post(
+        # 音声クエリはモーラごとの配列を含み大きいため、JSON 化したバイト列を直接送る
+        with http.post(
             f"{voicevox_url}/synthesis",
             params={"speaker": speaker_id},
-            json=audio_query,
-            timeout=timeout
-        )
-        response.raise_for_status()
-
-        # WAVファイルとして保存
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+            data=json_dumps_bytes(audio_query),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+
+            # WAVファイルとして保存
+            # 受信したチャンクから順に書き込み、レスポンス全体をメモリに保持しない
+            # 一時ファイルに書き込んでから置き換え、書きかけのファイルがキャッシュとして使われないようにする
+            tmp = tempfile.NamedTemporaryFile(
+                'wb',
+                dir=os.path.dirname(output_path) or '.',
+                suffix='.tmp',
+                delete=False
+            )
+            try:
+                # ソケットからファイルへ直接コピーし、チャンクごとのジェネレーターを介さない
+                # （Content-Encoding が付いた場合に備えて展開は urllib3 に任せる）
+                response.raw.decode_content = True
+                with tmp:
+                    shutil.copyfileobj(response.raw, tmp, SYNTHESIS_CHUNK_SIZE)
+                os.replace(tmp.name, output_path)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
 
         return True
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+        # raw から直接読むため、受信途中の切断は urllib3 の例外として送出される
         print(f"音声合成に失敗: {e}", file=sys.stderr)
         return False
 
 
+def synthesize_text(
+    text: str,
+    config: Dict[str, Any],
+    output_path: str,
+    session: Optional["requests.Session"] = None
+) -> bool:
+    """
+    音声クエリの作成から音声合成までを行う
+
+    Args:
+        text: 読み上げテキスト
+        config: VOICEVOX 設定
+        output_path: 出力WAVファイルパス
+        session: 接続を再利用する HTTP セッション
+
+    Returns:
+        成功時 True
+    """
+    audio_query = create_audio_query(
+        config["voicevox_url"],
+        text,
+        config["speaker_id"],
+        config.get("timeout", 30),
+        session
+    )
+    if not audio_query:
+        return False
+
+    # 速度、音高、音量を調整
+    audio_query["speedScale"] = config.get("speed_scale", 1.0)
+    audio_query["pitchScale"] = config.get("pitch_scale", 0.0)
+    audio_query["volumeScale"] = config.get("volume_scale", 1.0)
+
+    return synthesize_speech(
+        config["voicevox_url"],
+        audio_query,
+        config["speaker_id"],
+        output_path,
+        config.get("timeout", 30),
+        session
+    )
+
+
+def audio_cache_key(text: str, config: Dict[str, Any]) -> str:
+    """
+    合成音声のキャッシュキーを取得
+
+    同じテキストと音声パラメータからは同じ音声が合成されるため、
+    それらのハッシュをキーにする
+
+    Args:
+        text: 読み上げテキスト
+        config: VOICEVOX 設定
+
+    Returns:
+        キャッシュキー（16進文字列）
+    """
+    source = "|".join([
+        text,
+        str(config["speaker_id"]),
+        str(config.get("speed_scale", 1.0)),
+        str(config.get("pitch_scale", 0.0)),
+        str(config.get("volume_scale", 1.0)),
+    ])
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# WAV ヘッダーのサイズ（これ以下のファイルは音声データを含まない）
+WAV_HEADER_SIZE = 44
+
+
+# 合成済み音声のキャッシュディレクトリと保持するファイル数のデフォルト値
+DEFAULT_AUDIO_CACHE_DIR = "~/.cache/voicevox"
+DEFAULT_AUDIO_CACHE_MAX_FILES = 1024
+
+
+def get_audio_cache_dir(config: Dict[str, Any]) -> Path:
+    """
+    合成済み音声のキャッシュディレクトリを取得
+
+    以前の設定キー audio_output_dir も受け付ける
+
+    Args:
+        config: VOICEVOX 設定
+
+    Returns:
+        キャッシュディレクトリのパス（~ は展開済み）
+    """
+    cache_dir = (
+        config.get("audio_cache_dir")
+        or config.get("audio_output_dir")
+        or DEFAULT_AUDIO_CACHE_DIR
+    )
+    return Path(cache_dir).expanduser()
+
+
+def prune_audio_cache(cache_dir: Path, max_files: int) -> int:
+    """
+    キャッシュの音声ファイルが max_files を超えた分を、更新時刻の古いものから削除
+
+    キャッシュを再利用した音声は更新時刻を新しくしておくことで、最近使われていないものから消える
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+        max_files: 保持する最大ファイル数
+
+    Returns:
+        削除したファイル数
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".wav")]
+    except FileNotFoundError:
+        return 0
+
+    excess = len(entries) - max_files
+    if excess <= 0:
+        return 0
+
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    removed = 0
+    for entry in entries[:excess]:
+        try:
+            os.unlink(entry.path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def is_cached_audio(output_path: str) -> bool:
+    """
+    合成済みの音声ファイルが再利用できるかを確認
+
+    Args:
+        output_path: audio_cache_key() をファイル名にした WAV ファイルのパス
+
+    Returns:
+        音声データを含むファイルが存在する場合 True
+    """
+    try:
+        return os.stat(output_path).st_size > WAV_HEADER_SIZE
+    except OSError:
+        return False
+
+
+def synthesize_pipelined(
+    jobs: Iterable[Tuple[str, str]],
+    config: Dict[str, Any],
+    max_workers: Optional[int] = None,
+    prefetch: int = 4,
+    session: Optional["requests.Session"] = None
+) -> Iterator[Tuple[str, bool]]:
+    """
+    複数テキストの音声合成をバックグラウンドで先行して実行する
+
+    呼び出し側が i 番目の音声を再生している間に、i+1 番目以降の
+    音声クエリ作成と音声合成を進める。結果は投入順に返す。
+
+    Args:
+        jobs: (読み上げテキスト, 出力WAVファイルパス) のイテラブル
+        config: VOICEVOX 設定
+        max_workers: 同時に実行する音声合成の数
+            （省略時は設定の synthesis_workers、CPU コア数が上限）
+        prefetch: 先行して投入する最大件数（max_workers 未満の場合は max_workers）
+        session: 接続を再利用する HTTP セッション
+
+    Yields:
+        (出力WAVファイルパス, 成功時 True) のタプル
+    """
+    if max_workers is None:
+        max_workers = config.get("synthesis_workers", DEFAULT_SYNTHESIS_WORKERS)
+    max_workers = max(1, min(int(max_workers), MAX_SYNTHESIS_WORKERS))
+    # 全ワーカーが埋まるだけのジョブを先行投入する
+    prefetch = max(prefetch, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for text, output_path in jobs:
+            future = executor.submit(synthesize_text, text, config, output_path, session)
+            pending.append((output_path, future))
+
+            if len(pending) >= prefetch:
+                output_path, future = pending.popleft()
+                yield output_path, future.result()
+
+        while pending:
+            output_path, future = pending.popleft()
+            yield output_path, future.result()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_afplay() -> Optional[str]:
+    """
+    afplay コマンドの絶対パスを探す（結果はキャッシュ）
+
+    Returns:
+        afplay の絶対パス（見つからない場合 None）
+    """
+    return shutil.which("afplay")
+
+
+def start_audio(audio_path: str) -> Optional[subprocess.Popen]:
+    """
+    音声ファイルの再生を開始する（再生の完了は待たない）
+
+    afplay を絶対パスで close_fds=False のまま起動することで、
+    macOS では fork/exec ではなく posix_spawn で起動される
+    （Python が開くファイルはデフォルトで継承されないため fd は漏れない）
+
+    Args:
+        audio_path: 音声ファイルパス
+
+    Returns:
+        再生中のプロセス（起動できなかった場合 None）
+    """
+    afplay = _find_afplay()
+    if afplay is None:
+        print("afplay コマンドが見つかりません（macOS 以外の環境では使用できません）", file=sys.stderr)
+        return None
+
+    try:
+        return subprocess.Popen(
+            [afplay, audio_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False
+        )
+    except OSError as e:
+        print(f"音声再生に失敗: {e}", file=sys.stderr)
+        return None
+
+
 def play_audio(audio_path: str, dry_run: bool = False) -> bool:
     """
     音声ファイルを再生（macOS の afplay を使用）
@@ -341,21 +1101,59 @@ def play_audio(audio_path: str, dry_run: bool = False) -> bool:
         print(f"[DRY RUN] 音声再生をスキップ: {audio_path}")
         return True
 
-    try:
-        # macOS の afplay コマンドで再生
-        subprocess.run(
-            ["afplay", audio_path],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"音声再生に失敗: {e}", file=sys.stderr)
+    process = start_audio(audio_path)
+    if process is None:
         return False
-    except FileNotFoundError:
-        print("afplay コマンドが見つかりません（macOS 以外の環境では使用できません）", file=sys.stderr)
+
+    returncode = process.wait()
+    if returncode != 0:
+        print(f"音声再生に失敗: afplay が終了コード {returncode} で終了しました", file=sys.stderr)
         return False
+    return True
+
+
+def load_last_read(last_read_file: Path) -> Tuple[int, Optional[str]]:
+    """
+    前回の読み上げ位置を読み込む
+
+    読み上げ位置ファイルは {"offset": バイト位置, "timestamp": "..."} の JSON
+    以前の形式（タイムスタンプのみのテキスト）の場合は先頭から読み直す
+
+    Args:
+        last_read_file: 読み上げ位置ファイルのパス
+
+    Returns:
+        (transcript の読み取り開始位置, 前回読み上げた最後のタイムスタンプ) のタプル
+    """
+    # 存在確認は行わず、ファイル全体を1回で読み込む
+    try:
+        data = last_read_file.read_bytes().strip()
+    except FileNotFoundError:
+        return 0, None
+
+    try:
+        state = json_loads(data)
+    except JSON_DECODE_ERRORS:
+        state = None
+
+    if not isinstance(state, dict):
+        # 以前の形式: タイムスタンプのみ
+        return 0, data.decode('utf-8') or None
+
+    return int(state.get("offset") or 0), state.get("timestamp")
+
+
+def save_last_read(last_read_file: Path, offset: int, timestamp: Optional[str]):
+    """
+    読み上げ位置を保存
+
+    Args:
+        last_read_file: 読み上げ位置ファイルのパス
+        offset: 次回の transcript の読み取り開始位置
+        timestamp: 最後に読み上げたメッセージのタイムスタンプ
+    """
+    with open(last_read_file, 'wb') as f:
+        f.write(json_dumps_bytes({"offset": offset, "timestamp": timestamp}))
 
 
 def main(transcript_path: Optional[str] = None):
@@ -390,85 +1188,110 @@ def main(transcript_path: Optional[str] = None):
         print("VOICEVOX 音声読み上げは無効です")
         sys.exit(0)
 
-    # VOICEVOX Engine への接続をチェック
+    # VOICEVOX Engine への接続チェックを裏で進めながら、メッセージの抽出を行う
+    # （チェックは TCP 接続のみで共有セッションは使わないため、接続の待ち時間を重ねるだけ）
     voicevox_url = config["voicevox_url"]
-    if not check_voicevox_connection(voicevox_url):
-        print(f"VOICEVOX Engine に接続できません: {voicevox_url}", file=sys.stderr)
-        print("docker-compose up -d で起動してください", file=sys.stderr)
-        sys.exit(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connection_check = executor.submit(check_voicevox_connection, voicevox_url)
 
-    # 前回読み上げ位置ファイルのパス
-    last_read_file = Path(f"/tmp/voicevox_last_read_{session_id}.txt")
+        # 前回読み上げ位置ファイルのパス
+        last_read_file = Path(f"/tmp/voicevox_last_read_{session_id}.txt")
 
-    # 前回のタイムスタンプを読み込む
-    last_timestamp = None
-    if last_read_file.exists():
+        # 前回の読み取り位置とタイムスタンプを読み込む
+        last_offset, last_timestamp = 0, None
         try:
-            with open(last_read_file, 'r') as f:
-                last_timestamp = f.read().strip()
+            last_offset, last_timestamp = load_last_read(last_read_file)
+            if last_timestamp:
                 print(f"前回読み上げ位置: {last_timestamp}")
         except Exception as e:
             print(f"前回読み上げ位置の読み込みに失敗: {e}", file=sys.stderr)
 
-    # 新しい assistant メッセージを抽出
-    new_messages = extract_new_assistant_messages(transcript_path, last_timestamp)
+        # 前回の読み取り位置以降から新しい assistant メッセージを抽出
+        new_messages, next_offset = extract_new_assistant_messages_with_offset(
+            transcript_path, last_timestamp, last_offset
+        )
+
+        # 合成済み音声のキャッシュディレクトリを作成
+        output_dir = get_audio_cache_dir(config)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        is_connected = connection_check.result()
+
+    if not is_connected:
+        print(f"VOICEVOX Engine に接続できません: {voicevox_url}", file=sys.stderr)
+        print("docker-compose up -d で起動してください", file=sys.stderr)
+        sys.exit(1)
+
     if not new_messages:
+        # 読み取り位置のみ進めておき、次回は追記された行だけを読む
+        if next_offset != last_offset:
+            try:
+                save_last_read(last_read_file, next_offset, last_timestamp)
+            except Exception as e:
+                print(f"読み上げ位置の保存に失敗: {e}", file=sys.stderr)
+
         print("読み上げる新しいメッセージがありません")
         sys.exit(0)
 
     print(f"新しいメッセージ: {len(new_messages)}件")
 
-    # 出力ディレクトリを作成
-    output_dir = Path(config.get("audio_output_dir", "/tmp/voicevox_audio"))
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # 各メッセージを順番に読み上げる
+    # 各メッセージを文単位に分割して順番に読み上げる
+    # 再生中に後続の文の音声クエリ作成と音声合成を先行して進める
+    # 音声はテキストと音声パラメータのハッシュをファイル名にし、合成済みのものは再利用する
+    plan = []
+    jobs = []
+    scheduled = set()
     for i, msg in enumerate(new_messages):
-        message_text = msg["text"]
-        timestamp = msg["timestamp"]
-
-        print(f"[{i+1}/{len(new_messages)}] 読み上げ: {message_text[:100]}...")
-
-        # 音声クエリを作成
-        audio_query = create_audio_query(
-            voicevox_url,
-            message_text,
-            config["speaker_id"],
-            config.get("timeout", 30)
-        )
+        for j, sentence in enumerate(split_sentences(msg["text"])):
+            output_path = str(output_dir / f"{audio_cache_key(sentence, config)}.wav")
+            if output_path in scheduled:
+                needs_synthesis = False
+            elif is_cached_audio(output_path):
+                needs_synthesis = False
+                # 再利用した音声は古いものから削除する際に残るよう、更新時刻を新しくする
+                try:
+                    os.utime(output_path)
+                except OSError:
+                    pass
+            else:
+                needs_synthesis = True
+                scheduled.add(output_path)
+                jobs.append((sentence, output_path))
+            plan.append((i, j, output_path, needs_synthesis))
+
+    synthesized = synthesize_pipelined(jobs, config)
 
-        if not audio_query:
-            print(f"メッセージ {i+1} の音声クエリ作成に失敗", file=sys.stderr)
-            continue
+    try:
+        for i, j, output_path, needs_synthesis in plan:
+            if j == 0:
+                print(f"[{i+1}/{len(new_messages)}] 読み上げ: {new_messages[i]['text'][:100]}...")
 
-        # 速度、音高、音量を調整
-        audio_query["speedScale"] = config.get("speed_scale", 1.0)
-        audio_query["pitchScale"] = config.get("pitch_scale", 0.0)
-        audio_query["volumeScale"] = config.get("volume_scale", 1.0)
-
-        # 音声を合成
-        output_path = output_dir / f"message_{i}.wav"
-        if not synthesize_speech(
-            voicevox_url,
-            audio_query,
-            config["speaker_id"],
-            str(output_path),
-            config.get("timeout", 30)
-        ):
-            print(f"メッセージ {i+1} の音声合成に失敗", file=sys.stderr)
-            continue
+            # 合成が必要な文は、投入順に結果を受け取る
+            if needs_synthesis and not next(synthesized)[1]:
+                print(f"メッセージ {i+1} の音声合成に失敗", file=sys.stderr)
+                continue
 
-        # 音声を再生
-        if not play_audio(str(output_path)):
-            print(f"メッセージ {i+1} の音声再生に失敗", file=sys.stderr)
-            continue
+            # 音声を再生
+            if not play_audio(output_path):
+                print(f"メッセージ {i+1} の音声再生に失敗", file=sys.stderr)
+                continue
+    finally:
+        # 先行中の音声合成の完了を待ってから、VOICEVOX への接続を解放
+        synthesized.close()
+        _close_session()
+
+    # 新しく合成した分だけキャッシュが増えるため、上限を超えた古い音声を削除
+    if jobs:
+        prune_audio_cache(
+            output_dir,
+            config.get("audio_cache_max_files", DEFAULT_AUDIO_CACHE_MAX_FILES)
+        )
 
-    # 最後のメッセージのタイムスタンプを保存
+    # 読み取り位置と最後のメッセージのタイムスタンプを保存
     if new_messages:
         last_message_timestamp = new_messages[-1]["timestamp"]
         try:
-            with open(last_read_file, 'w') as f:
-                f.write(last_message_timestamp)
+            save_last_read(last_read_file, next_offset, last_message_timestamp)
             print(f"読み上げ位置を保存: {last_message_timestamp}")
         except Exception as e:
             print(f"読み上げ位置の保存に失敗: {e}", file=sys.stderr)
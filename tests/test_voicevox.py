@@ -6,8 +6,14 @@ TDD に基づき、期待される入出力を定義
 
 import sys
 import os
+import io
 import json
+import struct
 import tempfile
+import atexit
+import shutil
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # プロジェクトルートをPythonパスに追加
@@ -56,6 +62,28 @@ except ImportError as e:
     delete_session_config = None
 
 
+# モニターテスト用の監視ディレクトリ（初回使用時に作成）
+_monitor_watch_dir = None
+
+
+def get_monitor_watch_dir() -> str:
+    """
+    モニターテスト用の監視ディレクトリを取得
+
+    テストごとに一時ディレクトリを作り直さず、プロセス内で1つを使い回す
+    （tmpfs の /dev/shm があればそこに作成し、プロセス終了時に削除する）
+
+    Returns:
+        監視ディレクトリのパス
+    """
+    global _monitor_watch_dir
+    if _monitor_watch_dir is None:
+        base_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        _monitor_watch_dir = tempfile.mkdtemp(prefix="cc-avator-tests-", dir=base_dir)
+        atexit.register(shutil.rmtree, _monitor_watch_dir, ignore_errors=True)
+    return _monitor_watch_dir
+
+
 def test_load_config():
     """設定ファイルの読み込みテスト"""
     config_path = project_root / "config" / "voicevox.json"
@@ -87,6 +115,98 @@ def test_check_voicevox_connection():
     return True
 
 
+def test_check_voicevox_connection_tcp():
+    """TCP 接続のみによる接続チェックのテスト（ローカルのソケットを使う）"""
+    import socket
+    import time
+
+    import requests
+
+    # accept も応答もしないサーバーでも、TCP 接続ができれば接続可能と判定する
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    port = server.getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+
+    try:
+        start = time.monotonic()
+        assert check_voicevox_connection(url) is True
+        assert time.monotonic() - start < 1.0, "TCP check should not wait for an HTTP response"
+
+        # HTTP で確認する場合は応答がないため接続不可と判定する
+        assert check_voicevox_connection(
+            url, timeout=0.2, session=requests.Session(), verify_http=True
+        ) is False
+    finally:
+        server.close()
+
+    # 待ち受けていないポートは接続不可
+    assert check_voicevox_connection(url) is False
+
+    # ホスト名のない URL は接続不可
+    assert check_voicevox_connection("not a url") is False
+
+    print("✓ test_check_voicevox_connection_tcp passed")
+    return True
+
+
+def test_create_http_session():
+    """HTTP セッションの再試行のテスト（最初の接続だけ応答せずに切断するローカルサーバーを使う）"""
+    try:
+        from voicevox_tts import create_http_session
+    except ImportError:
+        print("スキップ: create_http_session がインポートできません")
+        return False
+
+    import socket
+    import threading
+
+    import requests
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    server.settimeout(5)
+    url = f"http://127.0.0.1:{server.getsockname()[1]}/version"
+
+    def serve(responses):
+        # 接続ごとにリクエストを受け取り、None なら応答せずに切断する
+        for response in responses:
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(65536)
+                if response is not None:
+                    conn.sendall(response)
+
+    ok = b'HTTP/1.1 200 OK\r\nContent-Length: 7\r\nConnection: close\r\n\r\n"0.0.0"'
+
+    try:
+        # 再試行しないセッションでは、切断がそのままエラーになる
+        thread = threading.Thread(target=serve, args=([None],))
+        thread.start()
+        try:
+            requests.Session().get(url, timeout=5)
+            assert False, "Plain session should fail on a dropped connection"
+        except requests.exceptions.ConnectionError:
+            pass
+        thread.join()
+
+        # create_http_session のセッションは再試行して応答を受け取る
+        thread = threading.Thread(target=serve, args=([None, ok],))
+        thread.start()
+        with create_http_session() as session:
+            response = session.get(url, timeout=5)
+        thread.join()
+        assert response.status_code == 200
+        assert response.content == b'"0.0.0"'
+    finally:
+        server.close()
+
+    print("✓ test_create_http_session passed")
+    return True
+
+
 def test_extract_latest_assistant_message():
     """transcript から最新 assistant メッセージを抽出するテスト"""
     # ClaudeCode の実際の transcript 形式でテスト用データを作成
@@ -224,6 +344,173 @@ def test_extract_new_assistant_messages():
         os.unlink(temp_path)
 
 
+def test_extract_new_assistant_messages_with_offset():
+    """前回の読み取り位置から新しい assistant メッセージを抽出するテスト"""
+    try:
+        from voicevox_tts import extract_new_assistant_messages_with_offset
+    except ImportError:
+        print("スキップ: extract_new_assistant_messages_with_offset がインポートできません")
+        return False
+
+    def entry(text, timestamp):
+        return json.dumps({
+            "message": {"role": "assistant", "content": [{"type": "text", "text": text}]},
+            "timestamp": timestamp
+        }) + "\n"
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+        f.write(entry("1番目", "2026-01-22T05:00:00.000Z"))
+        f.write(entry("2番目", "2026-01-22T05:01:00.000Z"))
+        temp_path = f.name
+
+    try:
+        # 先頭から読むと全件と、ファイル末尾の位置を返す
+        messages, offset = extract_new_assistant_messages_with_offset(temp_path)
+        assert [m["text"] for m in messages] == ["1番目", "2番目"]
+        assert offset == os.path.getsize(temp_path)
+
+        # 追記された行のみを読む（書き込み途中の末尾行では位置を進めない）
+        with open(temp_path, 'a') as f:
+            f.write(entry("3番目", "2026-01-22T05:02:00.000Z"))
+            f.write('{"message": {"role": "assis')
+        messages, next_offset = extract_new_assistant_messages_with_offset(
+            temp_path, "2026-01-22T05:01:00.000Z", offset
+        )
+        assert [m["text"] for m in messages] == ["3番目"]
+        assert next_offset == os.path.getsize(temp_path) - len('{"message": {"role": "assis')
+
+        # ファイルサイズを超える位置は先頭から読み直す
+        messages, _ = extract_new_assistant_messages_with_offset(temp_path, None, 10 ** 9)
+        assert len(messages) == 3
+
+        print("✓ test_extract_new_assistant_messages_with_offset passed")
+        return True
+    finally:
+        os.unlink(temp_path)
+
+
+def test_last_read_state():
+    """読み上げ位置ファイルの保存と読み込みのテスト"""
+    try:
+        from voicevox_tts import load_last_read, save_last_read
+    except ImportError:
+        print("スキップ: load_last_read / save_last_read がインポートできません")
+        return False
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        last_read_file = Path(temp_dir) / "last_read.txt"
+
+        # ファイルがなければ先頭から読む
+        assert load_last_read(last_read_file) == (0, None)
+
+        # 保存した位置とタイムスタンプをそのまま読み込める
+        save_last_read(last_read_file, 1234, "2026-01-22T05:01:00.000Z")
+        assert load_last_read(last_read_file) == (1234, "2026-01-22T05:01:00.000Z")
+
+        # 新しいメッセージがなくても位置だけは保存できる
+        save_last_read(last_read_file, 0, None)
+        assert load_last_read(last_read_file) == (0, None)
+
+        # 以前の形式（タイムスタンプのみ）は先頭からタイムスタンプで絞り込む
+        last_read_file.write_text("2026-01-22T05:00:00.000Z\n")
+        assert load_last_read(last_read_file) == (0, "2026-01-22T05:00:00.000Z")
+
+        # 空のファイルは状態なしとして扱う
+        last_read_file.write_text("")
+        assert load_last_read(last_read_file) == (0, None)
+
+    print("✓ test_last_read_state passed")
+    return True
+
+
+def test_tail_messages():
+    """transcript 末尾から最新 assistant メッセージを抽出するテスト"""
+    try:
+        from voicevox_tts import tail_messages
+    except ImportError:
+        print("スキップ: tail_messages がインポートできません")
+        return False
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+        for i in range(200):
+            role = "assistant" if i % 2 else "user"
+            f.write(json.dumps({
+                "message": {
+                    "role": role,
+                    # ブロック境界をまたぐよう長めのテキストにする
+                    "content": [{"type": "text", "text": f"メッセージ{i} " + "あ" * 500}]
+                },
+                "timestamp": f"2026-01-22T05:{i // 60:02d}:{i % 60:02d}.000Z"
+            }) + "\n")
+        temp_path = f.name
+
+    try:
+        # 最新3件（古い順）
+        messages = tail_messages(temp_path, 3)
+        assert [m["text"].split()[0] for m in messages] == ["メッセージ195", "メッセージ197", "メッセージ199"]
+
+        # since_timestamp より新しいメッセージのみ
+        messages = tail_messages(temp_path, 10, since_timestamp="2026-01-22T05:03:15.000Z")
+        assert [m["timestamp"] for m in messages] == [
+            "2026-01-22T05:03:17.000Z",
+            "2026-01-22T05:03:19.000Z",
+        ]
+
+        # 全件を読み切る場合は先頭まで遡る
+        messages = tail_messages(temp_path, 1000)
+        assert len(messages) == 100
+        assert messages == extract_new_assistant_messages(temp_path)
+
+        print("✓ test_tail_messages passed")
+        return True
+    finally:
+        os.unlink(temp_path)
+
+
+def test_clean_text_for_speech():
+    """音声読み上げ用テキストのクリーンアップテスト"""
+    try:
+        from voicevox_tts import clean_text_for_speech
+    except ImportError:
+        print("スキップ: clean_text_for_speech がインポートできません")
+        return False
+
+    # Markdown記号・絵文字の除去とリンクのテキスト化
+    assert clean_text_for_speech("**太字** と [リンク](https://example.com) ✅") == "太字 と リンク"
+
+    # コードブロックとインラインコードは読み上げない
+    text = "実行します\n```python\nprint(1)\n```\n次は `npm install` です"
+    assert clean_text_for_speech(text) == "実行します 次は です"
+
+    # 空白のみの場合は空文字列
+    assert clean_text_for_speech("  \n\t ") == ""
+
+    print("✓ test_clean_text_for_speech passed")
+    return True
+
+
+def test_split_sentences():
+    """読み上げテキストの文分割テスト"""
+    try:
+        from voicevox_tts import split_sentences
+    except ImportError:
+        print("スキップ: split_sentences がインポートできません")
+        return False
+
+    # 句読点は各文の末尾に残す
+    assert split_sentences("こんにちは。元気ですか？ はい！") == ["こんにちは。", "元気ですか？", "はい！"]
+
+    # 改行でも区切り、末尾に句点がない文も含める
+    assert split_sentences("一行目\n二行目") == ["一行目", "二行目"]
+
+    # 空の文は除外
+    assert split_sentences("") == []
+    assert split_sentences("。。") == []
+
+    print("✓ test_split_sentences passed")
+    return True
+
+
 def test_create_audio_query():
     """音声クエリの作成テスト"""
     config_path = project_root / "config" / "voicevox.json"
@@ -280,27 +567,101 @@ def test_synthesize_speech():
             os.unlink(output_path)
 
 
+class _FakeVoicevoxResponse:
+    """VOICEVOX Engine の応答の代わり（raise_for_status と with 文のみ対応）"""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.raw = io.BytesIO(content)
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _FakeVoicevoxSession:
+    """
+    VOICEVOX Engine の代わりに応答を返す HTTP セッション
+
+    音声クエリにはテキストをそのまま入れ、合成音声としてテキストのバイト列を返す
+    """
+
+    def __init__(self, delays=None, errors=()):
+        # {テキスト: 音声クエリ作成の遅延秒数}
+        self.delays = delays or {}
+        # 音声クエリ作成時に例外を送出するテキスト
+        self.errors = set(errors)
+
+    def post(self, url, params=None, data=None, **kwargs):
+        import time
+        if url.endswith("/audio_query"):
+            text = params["text"]
+            if text in self.errors:
+                raise RuntimeError(f"audio_query failed: {text}")
+            time.sleep(self.delays.get(text, 0))
+            return _FakeVoicevoxResponse(json.dumps({"text": text}).encode('utf-8'))
+
+        return _FakeVoicevoxResponse(json.loads(data)["text"].encode('utf-8'))
+
+
+def test_synthesize_pipelined():
+    """音声合成の先行実行のテスト（VOICEVOX Engine の代わりにスタブのセッションを使う）"""
+    try:
+        from voicevox_tts import synthesize_pipelined
+    except ImportError:
+        print("スキップ: synthesize_pipelined がインポートできません")
+        return False
+
+    config = {"voicevox_url": "http://voicevox.invalid", "speaker_id": 3, "timeout": 5}
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        texts = ["first", "second", "third", "fourth"]
+        jobs = [(text, os.path.join(output_dir, f"{text}.wav")) for text in texts]
+
+        # 先頭の合成を遅らせても、結果は投入順に返る
+        session = _FakeVoicevoxSession(delays={"first": 0.2})
+        results = list(synthesize_pipelined(jobs, config, max_workers=2, session=session))
+        assert results == [(path, True) for _, path in jobs], f"Got: {results}"
+        for text, path in jobs:
+            with open(path, 'rb') as f:
+                assert f.read() == text.encode('utf-8')
+
+        # ワーカーで発生した例外は、その結果を受け取る時点で呼び出し側に送出される
+        session = _FakeVoicevoxSession(errors={"second"})
+        synthesized = synthesize_pipelined(jobs, config, max_workers=2, session=session)
+        assert next(synthesized) == (jobs[0][1], True)
+        try:
+            next(synthesized)
+            assert False, "Worker exception should propagate"
+        except RuntimeError as e:
+            assert "second" in str(e)
+
+    print("✓ test_synthesize_pipelined passed")
+    return True
+
+
 def test_play_audio():
     """音声再生のテスト（実際には再生しない）"""
     # テスト用の空のWAVファイルを作成
     with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        # 簡易的なWAVヘッダーを書き込む
-        # RIFF header
-        f.write(b'RIFF')
-        f.write((36).to_bytes(4, 'little'))  # file size - 8
-        f.write(b'WAVE')
-        # fmt chunk
-        f.write(b'fmt ')
-        f.write((16).to_bytes(4, 'little'))  # chunk size
-        f.write((1).to_bytes(2, 'little'))   # audio format (PCM)
-        f.write((1).to_bytes(2, 'little'))   # channels
-        f.write((24000).to_bytes(4, 'little'))  # sample rate
-        f.write((48000).to_bytes(4, 'little'))  # byte rate
-        f.write((2).to_bytes(2, 'little'))   # block align
-        f.write((16).to_bytes(2, 'little'))  # bits per sample
-        # data chunk
-        f.write(b'data')
-        f.write((0).to_bytes(4, 'little'))   # data size
+        # 簡易的なWAVヘッダー（44バイト）を組み立てて1回で書き込む
+        f.write(struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36, b'WAVE',   # RIFF header（file size - 8）
+            b'fmt ', 16,            # fmt chunk（chunk size）
+            1,                      # audio format (PCM)
+            1,                      # channels
+            24000,                  # sample rate
+            48000,                  # byte rate
+            2,                      # block align
+            16,                     # bits per sample
+            b'data', 0              # data chunk（data size）
+        ))
 
         temp_path = f.name
 
@@ -313,6 +674,43 @@ def test_play_audio():
         os.unlink(temp_path)
 
 
+def test_audio_cache():
+    """合成済み音声キャッシュのディレクトリ取得と削除のテスト"""
+    try:
+        from voicevox_tts import get_audio_cache_dir, prune_audio_cache
+    except ImportError:
+        print("スキップ: 音声キャッシュの関数がインポートできません")
+        return False
+
+    # audio_cache_dir を優先し、以前の audio_output_dir も受け付ける
+    assert get_audio_cache_dir({"audio_cache_dir": "~/voicevox_test"}) == Path.home() / "voicevox_test"
+    assert get_audio_cache_dir({"audio_output_dir": "/tmp/voicevox_audio"}) == Path("/tmp/voicevox_audio")
+    assert get_audio_cache_dir({}) == Path.home() / ".cache" / "voicevox"
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # 更新時刻が古い順に a〜e の音声と、対象外のファイルを作成
+        for i, name in enumerate(["a", "b", "c", "d", "e"]):
+            path = os.path.join(cache_dir, f"{name}.wav")
+            with open(path, 'wb') as f:
+                f.write(b'RIFF')
+            os.utime(path, (1000 + i, 1000 + i))
+        with open(os.path.join(cache_dir, "other.tmp"), 'wb') as f:
+            f.write(b'tmp')
+
+        # 上限以下なら何も削除しない
+        assert prune_audio_cache(Path(cache_dir), 5) == 0
+
+        # 古いものから上限を超えた分だけ削除する
+        assert prune_audio_cache(Path(cache_dir), 3) == 2
+        assert sorted(os.listdir(cache_dir)) == ["c.wav", "d.wav", "e.wav", "other.tmp"]
+
+    # ディレクトリが存在しなくてもエラーにしない
+    assert prune_audio_cache(Path(cache_dir), 3) == 0
+
+    print("✓ test_audio_cache passed")
+    return True
+
+
 def test_monitor_initialization():
     """TranscriptMonitor の初期化テスト"""
     if TranscriptMonitor is None:
@@ -323,17 +721,100 @@ def test_monitor_initialization():
     config = load_config(config_path)
 
     # モニターを初期化
-    with tempfile.TemporaryDirectory() as watch_dir:
-        monitor = TranscriptMonitor(
-            watch_dir=watch_dir,
-            config=config
-        )
+    watch_dir = get_monitor_watch_dir()
+    monitor = TranscriptMonitor(
+        watch_dir=watch_dir,
+        config=config
+    )
+
+    # モニターが正しく初期化されたことを確認
+    assert monitor.watch_dir == watch_dir
+    assert monitor.config == config
+    print("✓ test_monitor_initialization passed")
+
+    return True
 
-        # モニターが正しく初期化されたことを確認
-        assert monitor.watch_dir == watch_dir
-        assert monitor.config == config
-        print("✓ test_monitor_initialization passed")
 
+def test_monitor_audio_cache():
+    """モニターの合成済み音声索引のテスト"""
+    if TranscriptMonitor is None:
+        print("スキップ: TranscriptMonitor がインポートできません")
+        return False
+
+    monitor = TranscriptMonitor(
+        watch_dir=get_monitor_watch_dir(),
+        config=load_config(project_root / "config" / "voicevox.json")
+    )
+    monitor.audio_cache_size = 2
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = os.path.join(cache_dir, f"{name}.wav")
+            with open(path, 'wb') as f:
+                f.write(b'RIFF')
+            monitor.remember_audio(name, path)
+            paths.append(path)
+
+        # 上限を超えた分は索引から外れるが、共有キャッシュのファイルは消さない
+        assert monitor.get_cached_audio("a") is None
+        assert os.path.exists(paths[0]), "Evicted audio file should be left to prune_audio_cache"
+        assert monitor.get_cached_audio("b") == paths[1]
+        assert monitor.get_cached_audio("c") == paths[2]
+
+        # ファイルが削除されていれば索引からも外す
+        os.unlink(paths[1])
+        assert monitor.get_cached_audio("b") is None
+        assert "b" not in monitor.audio_cache
+
+    print("✓ test_monitor_audio_cache passed")
+    return True
+
+
+def test_monitor_stop_during_dispatch():
+    """通知処理の実行中に stop() した場合のテスト"""
+    if TranscriptMonitor is None:
+        print("スキップ: TranscriptMonitor がインポートできません")
+        return False
+
+    import threading
+    import time
+    from voicevox_monitor import TranscriptFileHandler
+
+    # stop() は PID ファイルを削除するため、他のモニターのテストと別の監視ディレクトリを使う
+    watch_dir = tempfile.mkdtemp()
+    monitor = TranscriptMonitor(
+        watch_dir=watch_dir,
+        config=load_config(project_root / "config" / "voicevox.json")
+    )
+    monitor.event_handler = TranscriptFileHandler(monitor)
+
+    entered = threading.Event()
+    calls = []
+
+    def slow_on_file_modified(file_path):
+        calls.append(file_path)
+        entered.set()
+        time.sleep(0.2)
+        calls.append("done")
+
+    monitor.on_file_modified = slow_on_file_modified
+
+    # 通知処理の実行中に stop() を呼ぶと、通知処理の完了を待ってから戻る
+    dispatch = threading.Thread(target=monitor.event_handler._dispatch, args=("a.jsonl",))
+    dispatch.start()
+    assert entered.wait(5), "Dispatch did not start"
+    monitor.stop()
+    assert calls == ["a.jsonl", "done"], f"stop() returned before the dispatch finished: {calls}"
+    dispatch.join()
+
+    # stop() 後に発火した通知はモニターに届かない
+    monitor.event_handler._dispatch("b.jsonl")
+    assert calls == ["a.jsonl", "done"], f"Dispatch ran after stop(): {calls}"
+    assert monitor._http is None
+    os.rmdir(watch_dir)
+
+    print("✓ test_monitor_stop_during_dispatch passed")
     return True
 
 
@@ -346,23 +827,22 @@ def test_monitor_pid_file():
     config_path = project_root / "config" / "voicevox.json"
     config = load_config(config_path)
 
-    with tempfile.TemporaryDirectory() as watch_dir:
-        monitor = TranscriptMonitor(
-            watch_dir=watch_dir,
-            config=config
-        )
+    monitor = TranscriptMonitor(
+        watch_dir=get_monitor_watch_dir(),
+        config=config
+    )
 
-        # PIDファイルのパスを取得
-        pid_file = monitor.get_pid_file()
+    # PIDファイルのパスを取得
+    pid_file = monitor.get_pid_file()
 
-        # PIDファイルのパスが期待通りであることを確認
-        assert str(pid_file).startswith("/tmp/voicevox_monitor_")
-        assert str(pid_file).endswith(".pid")
+    # PIDファイルのパスが期待通りであることを確認
+    assert str(pid_file).startswith("/tmp/voicevox_monitor_")
+    assert str(pid_file).endswith(".pid")
 
-        # PIDファイルは初期状態では存在しないはず
-        assert not pid_file.exists()
+    # PIDファイルは初期状態では存在しないはず
+    assert not pid_file.exists()
 
-        print("✓ test_monitor_pid_file passed")
+    print("✓ test_monitor_pid_file passed")
 
     return True
 
@@ -435,6 +915,15 @@ def test_transcript_stream_reader():
         new_lines = reader.read_new_lines()
         assert len(new_lines) == 2, f"Expected 2 new lines, got {len(new_lines)}"
 
+        # 改行で終わっていない行は書き込みが完了するまで返さない
+        with open(temp_path, 'a', encoding='utf-8') as f:
+            f.write('{"n": ')
+        assert reader.read_new_lines() == []
+
+        with open(temp_path, 'a', encoding='utf-8') as f:
+            f.write('3}\n')
+        assert reader.read_new_lines() == ['{"n": 3}']
+
         reader.close()
         print("✓ test_transcript_stream_reader passed")
         return True
@@ -493,6 +982,12 @@ def test_save_and_load_session_config():
         assert "voicevox_url" in loaded_config, "voicevox_url should be inherited from global config"
         assert "timeout" in loaded_config, "timeout should be inherited from global config"
 
+        # 保存したファイルは一時ファイルの 0600 ではなく、通常の作成と同じ権限になる
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = get_session_config_path(session_id, project_root).stat().st_mode & 0o777
+        assert mode == 0o666 & ~umask, f"Expected mode={oct(0o666 & ~umask)}, Got: {oct(mode)}"
+
         print("✓ test_save_and_load_session_config passed")
         return True
 
@@ -769,6 +1264,106 @@ def test_monitor_management():
             pass
 
 
+def test_directory_watcher():
+    """PIDファイル待ちのディレクトリ監視のテスト"""
+    try:
+        from voicevox_skill import _DirectoryWatcher
+    except ImportError:
+        print("スキップ: voicevox_skill モジュールがインポートできません")
+        return False
+
+    import threading
+    import time
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        watcher = _DirectoryWatcher(temp_dir, "monitor.pid")
+        try:
+            # 無関係なファイルの作成の後に、対象のファイルを作成する
+            other = threading.Timer(0.05, Path(temp_dir, "other.tmp").touch)
+            target = threading.Timer(0.2, Path(temp_dir, "monitor.pid").touch)
+            other.start()
+            target.start()
+
+            start = time.monotonic()
+            watcher.wait(5.0)
+            elapsed = time.monotonic() - start
+            other.join()
+            target.join()
+
+            assert elapsed < 2.0, "Watcher did not wake on the target file"
+            # inotify ではファイル名で絞り込み、無関係なファイルでは起きない
+            if watcher._inotify is not None:
+                assert elapsed >= 0.15, f"Woke on an unrelated file after {elapsed:.3f}s"
+        finally:
+            watcher.close()
+
+    print("✓ test_directory_watcher passed")
+    return True
+
+
+def test_wait_pid_exit():
+    """プロセス終了待ちのテスト"""
+    try:
+        from voicevox_skill import _wait_pid_exit
+    except ImportError:
+        print("スキップ: voicevox_skill モジュールがインポートできません")
+        return False
+
+    import subprocess
+    import time
+
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        # 実行中のプロセスはタイムアウトまで待って False を返す
+        start = time.monotonic()
+        assert _wait_pid_exit(process.pid, 0.1) is False
+        assert time.monotonic() - start >= 0.09, "Should wait until the timeout"
+
+        # 終了後まだ回収されていない（ゾンビの）プロセスも、すぐに終了と判定する
+        process.terminate()
+        start = time.monotonic()
+        assert _wait_pid_exit(process.pid, 5.0) is True
+        assert time.monotonic() - start < 2.0, "Exit of an unreaped child was not noticed"
+    finally:
+        process.kill()
+        process.wait()
+
+    # 回収済みで存在しない PID は終了済みとして扱う
+    assert _wait_pid_exit(process.pid, 0.1) is True
+
+    print("✓ test_wait_pid_exit passed")
+    return True
+
+
+def test_stop_monitor_recycled_pid():
+    """PIDファイルがモニター以外のプロセスを指している場合の停止テスト"""
+    try:
+        from voicevox_skill import stop_monitor
+    except ImportError:
+        print("スキップ: voicevox_skill モジュールがインポートできません")
+        return False
+
+    import subprocess
+
+    # PID が再利用され、無関係なプロセスを指している古い PID ファイル
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pid_file = Path(temp_dir) / "voicevox_monitor.pid"
+            pid_file.write_text(str(process.pid))
+
+            # シグナルを送らずに、古い PID ファイルのみを削除する
+            assert stop_monitor(project_root, pid_file) is True
+            assert process.poll() is None, "Non-monitor process must not be signalled"
+            assert not pid_file.exists()
+    finally:
+        process.kill()
+        process.wait()
+
+    print("✓ test_stop_monitor_recycled_pid passed")
+    return True
+
+
 def test_skill_on_with_monitor():
     """スキル on コマンドでモニターを起動するテスト"""
     try:
@@ -868,6 +1463,42 @@ def test_skill_off_with_monitor():
             delete_session_config(session_id, project_root)
 
 
+def _run_test(test_func):
+    """
+    テストを実行
+
+    Args:
+        test_func: テスト関数
+
+    Returns:
+        (結果, エラーメッセージ) のタプル
+        結果は "passed" / "failed" / "skipped" のいずれか
+    """
+    try:
+        result = test_func()
+    except Exception as e:
+        return "failed", str(e)
+    return ("skipped" if result is False else "passed"), None
+
+
+def _run_test_captured(test_func):
+    """
+    テストを実行し、結果と出力をまとめて返す（別プロセスでの並列実行用）
+
+    spawn でも渡せるよう、テスト関数はモジュール直下に定義したものに限る
+
+    Args:
+        test_func: テスト関数
+
+    Returns:
+        (結果, エラーメッセージ, 出力) のタプル
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        status, error = _run_test(test_func)
+    return status, error, output.getvalue()
+
+
 def run_all_tests():
     """すべてのテストを実行"""
     print("=" * 60)
@@ -877,12 +1508,23 @@ def run_all_tests():
     tests = [
         ("設定ファイル読み込み", test_load_config),
         ("VOICEVOX 接続チェック", test_check_voicevox_connection),
+        ("VOICEVOX 接続チェック（TCP）", test_check_voicevox_connection_tcp),
+        ("HTTP セッションの再試行", test_create_http_session),
         ("最新メッセージ抽出", test_extract_latest_assistant_message),
         ("新しいメッセージ抽出", test_extract_new_assistant_messages),
+        ("読み取り位置からのメッセージ抽出", test_extract_new_assistant_messages_with_offset),
+        ("読み上げ位置の保存と読み込み", test_last_read_state),
+        ("末尾メッセージ抽出", test_tail_messages),
+        ("読み上げテキストのクリーンアップ", test_clean_text_for_speech),
+        ("読み上げテキストの文分割", test_split_sentences),
         ("音声クエリ作成", test_create_audio_query),
         ("音声合成", test_synthesize_speech),
+        ("音声合成の先行実行", test_synthesize_pipelined),
         ("音声再生", test_play_audio),
+        ("音声キャッシュ", test_audio_cache),
         ("モニター初期化", test_monitor_initialization),
+        ("モニター音声キャッシュ", test_monitor_audio_cache),
+        ("モニター停止と通知処理", test_monitor_stop_during_dispatch),
         ("モニターPIDファイル", test_monitor_pid_file),
         ("TranscriptStreamReader", test_transcript_stream_reader),
         # Phase 1: セッション管理テスト
@@ -898,25 +1540,81 @@ def run_all_tests():
         ("[Phase2] スキル status コマンド", test_skill_status),
         # Phase 2 拡張: モニター起動/停止テスト
         ("[Phase2-Ext] モニター起動/停止管理", test_monitor_management),
+        ("[Phase2-Ext] PIDファイル待ち", test_directory_watcher),
+        ("[Phase2-Ext] モニター終了待ち", test_wait_pid_exit),
+        ("[Phase2-Ext] 再利用された PID のモニター停止", test_stop_monitor_recycled_pid),
         ("[Phase2-Ext] スキル on でモニター起動", test_skill_on_with_monitor),
         ("[Phase2-Ext] スキル off でモニター停止", test_skill_off_with_monitor),
     ]
 
+    # 他のテストと同時に実行しても干渉しないテスト
+    # （VOICEVOX Engine やモニタープロセスを使わず、一時ファイルか固有のセッションIDのみを扱う）
+    # 別プロセスで先に実行を始めておき、残りのテストは順番に実行する
+    parallel_tests = {
+        test_load_config,
+        test_check_voicevox_connection_tcp,
+        test_create_http_session,
+        test_extract_latest_assistant_message,
+        test_extract_new_assistant_messages,
+        test_extract_new_assistant_messages_with_offset,
+        test_last_read_state,
+        test_tail_messages,
+        test_clean_text_for_speech,
+        test_split_sentences,
+        test_synthesize_pipelined,
+        test_play_audio,
+        test_audio_cache,
+        test_monitor_initialization,
+        test_monitor_audio_cache,
+        test_monitor_stop_during_dispatch,
+        test_monitor_pid_file,
+        test_transcript_stream_reader,
+        test_get_session_config_path,
+        test_save_and_load_session_config,
+        test_config_merge_priority,
+        test_session_config_not_exists,
+        test_delete_session_config,
+        test_skill_speaker,
+        test_skill_speed,
+        test_skill_status,
+        test_directory_watcher,
+        test_wait_pid_exit,
+        test_stop_monitor_recycled_pid,
+    }
+
     passed = 0
     failed = 0
     skipped = 0
 
-    for name, test_func in tests:
-        print(f"\n[テスト] {name}")
-        try:
-            result = test_func()
-            if result is False:
-                skipped += 1
+    # 監視ディレクトリは並列実行用のプロセスを作る前に作成しておく
+    # fork で起動したプロセスはこのディレクトリを引き継ぐ（終了時の削除処理を実行しないため、削除はこのプロセスで行う）
+    # spawn で起動したプロセス（macOS の既定）はこのモジュールを読み込み直し、各自で作成・削除する
+    # どちらでも各テストはディレクトリの存在のみを前提とし、プロセス間で状態を共有しない
+    get_monitor_watch_dir()
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            test_func: executor.submit(_run_test_captured, test_func)
+            for _, test_func in tests
+            if test_func in parallel_tests
+        }
+
+        # 結果は登録順に表示する
+        for name, test_func in tests:
+            print(f"\n[テスト] {name}")
+            if test_func in futures:
+                status, error, output = futures[test_func].result()
+                print(output, end="")
             else:
+                status, error = _run_test(test_func)
+
+            if status == "passed":
                 passed += 1
-        except Exception as e:
-            print(f"✗ {name} failed: {e}")
-            failed += 1
+            elif status == "skipped":
+                skipped += 1
+            else:
+                print(f"✗ {name} failed: {error}")
+                failed += 1
 
     print("\n" + "=" * 60)
     print(f"結果: {passed} passed, {failed} failed, {skipped} skipped")